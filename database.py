@@ -4,17 +4,220 @@ Handles all database operations for the Beisman Maps application.
 """
 
 import pyodbc
+import asyncio
+import hashlib
+import hmac
 import logging
-from typing import List, Dict, Any, Optional, Union
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 import os
 from contextlib import contextmanager
-from dataclasses import dataclass
+from functools import lru_cache, wraps
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Connections are pooled by ConnectionPool below; driver-manager pooling on top
+# of that would double-pool and keep connections we have already discarded
+pyodbc.pooling = False
+
+def _credential_digest(value: str) -> bytes:
+    """SHA-256 digest used for constant-time credential comparison"""
+    return hashlib.sha256(value.encode("utf-8")).digest()
+
+# Declared parameter types/sizes (matching the model field limits) so the driver
+# binds bounded buffers instead of sizing each string parameter on its own
+_NUMBER_PARAM = (pyodbc.SQL_WVARCHAR, 50, 0)
+_DRAWER_PARAM = (pyodbc.SQL_WVARCHAR, 255, 0)
+_DETAILS_PARAM = (pyodbc.SQL_WVARCHAR, 1000, 0)
+_ENTITY_NAME_PARAM = (pyodbc.SQL_WVARCHAR, 255, 0)
+_INSERT_MAP_SIZES = [_NUMBER_PARAM, _DRAWER_PARAM, _DETAILS_PARAM, _NUMBER_PARAM]
+_ENTITY_PAIR_SIZES = [_NUMBER_PARAM, _ENTITY_NAME_PARAM, _NUMBER_PARAM, _ENTITY_NAME_PARAM]
+
+# Stay under SQL Server's 2100-parameter limit when expanding IN (...) lists
+_MAX_IN_PARAMS = 2000
+
+# Text columns matched by the map and entity searches (exact Streamlit column names)
+_MAPS_SEARCH_COLUMNS = ("[Number]", "[Drawer]", "[PropertyDetails]")
+_ENTITIES_SEARCH_COLUMNS = ("[EntityName]", "[BeismanNumber]")
+
+def _search_predicate(columns: tuple, search_term: str) -> tuple[str, list]:
+    """WHERE clause matching the term anywhere in any of the columns, plus its parameters"""
+    clause = " WHERE " + " OR ".join(f"{column} LIKE ?" for column in columns)
+    return clause, [f"%{search_term}%"] * len(columns)
+
+def _placeholders(count: int, group: str = "?") -> str:
+    """Comma-separated parameter markers, one group per value"""
+    return ", ".join([group] * count)
+
+def _existing_entities_sql(entities_table: str, track_number: str, names: List[str]) -> tuple[str, list]:
+    """SELECT (range-locked) of the given names the map already has"""
+    return (
+        f"SELECT [EntityName] FROM {entities_table} WITH (UPDLOCK, HOLDLOCK) "
+        f"WHERE [BeismanNumber] = ? AND [EntityName] IN ({_placeholders(len(names))})",
+        [track_number, *names],
+    )
+
+def _insert_entities_sql(entities_table: str, track_number: str, names: List[str]) -> tuple[str, list]:
+    """Set-based INSERT of the names the map doesn't have yet, so rowcount is the real count"""
+    return (
+        f"INSERT INTO {entities_table} ([BeismanNumber], [EntityName]) "
+        f"SELECT ?, v.[EntityName] FROM (VALUES {_placeholders(len(names), '(?)')}) AS v([EntityName]) "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {entities_table} e "
+        f"WHERE e.[BeismanNumber] = ? AND e.[EntityName] = v.[EntityName])",
+        [track_number, *names, track_number],
+    )
+
+def _remove_entities_sql(entities_table: str, track_number: str, names: List[str]) -> tuple[str, list]:
+    """DELETE of the given names from one map"""
+    return (
+        f"DELETE FROM {entities_table} "
+        f"WHERE [BeismanNumber] = ? AND [EntityName] IN ({_placeholders(len(names))})",
+        [track_number, *names],
+    )
+
+def _contains_term(search_term: str) -> str:
+    """Word-prefix term for CONTAINS, with embedded quotes doubled"""
+    return '"' + search_term.replace('"', '""') + '*"'
+
+# With a full-text index on the maps table, Drawer/PropertyDetails go through
+# CONTAINS, which matches word prefixes rather than arbitrary substrings;
+# Number keeps its substring match
+_MAPS_FULLTEXT_PREDICATE = " WHERE CONTAINS(([Drawer], [PropertyDetails]), ?) OR [Number] LIKE ?"
+
+# Display format for DATETIME columns returned to the API
+_DATETIME_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+# Fallback for get_current_timestamp when the server can't be asked
+_TIMESTAMP_FORMAT = "%m/%d/%Y, %I:%M:%S %p"
+
+def _format_datetime(value: datetime) -> str:
+    return value.strftime(_DATETIME_FORMAT)
+
+def _identity(value: Any) -> Any:
+    return value
+
+# (keys, converters) per query text, so repeated queries skip re-reading cursor.description
+_row_shapes: Dict[str, tuple] = {}
+
+def _row_shape(description, cache_key: Optional[str] = None) -> tuple:
+    """Column keys and per-column converters for a result set"""
+    if cache_key is not None:
+        shape = _row_shapes.get(cache_key)
+        # A column count mismatch means the selected columns changed shape
+        if shape is not None and len(shape[0]) == len(description):
+            return shape
+    keys = tuple(column[0] for column in description)
+    # Column types are fixed per result set, so pick each converter once
+    converters = tuple(_format_datetime if column[1] is datetime else _identity for column in description)
+    shape = (keys, converters)
+    if cache_key is not None:
+        _row_shapes[cache_key] = shape
+    return shape
+
+def _rows_to_dicts(cursor, rows=None, description=None, cache_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Convert result rows to dicts, formatting datetimes and turning NULLs into empty strings"""
+    # Trailing row values beyond the given description are dropped by zip()
+    keys, converters = _row_shape(description or cursor.description, cache_key)
+    if rows is None:
+        rows = cursor.fetchall()
+    return [
+        dict(zip(keys, ["" if value is None else convert(value) for convert, value in zip(converters, row)]))
+        for row in rows
+    ]
+
+def _page_rows_to_dicts(cursor, cache_key: Optional[str] = None) -> tuple[List[Dict[str, Any]], Optional[int]]:
+    """Split a page selected with a trailing COUNT(*) OVER () column into (rows, total)"""
+    rows = cursor.fetchall()
+    if not rows:
+        return [], None
+    return _rows_to_dicts(cursor, rows, cursor.description[:-1], cache_key), rows[0][-1]
+
+# Admin user credentials (matches your auth.py), kept only as digests
+_ADMIN_PASSWORD_DIGESTS = MappingProxyType({
+    "admin": _credential_digest("admin"),  # Change this in production!
+})
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Any, tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Any:
+        """Return the cached value, or None if absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+# Password digests of database users, keyed by username
+_credential_cache = _TTLCache(maxsize=1024, ttl=3600)
+
+# Paginated map/entity results; cleared by every write in this module
+_page_cache = _TTLCache(maxsize=128, ttl=30)
+
+# Single maps by (table, Number); entries are dropped when that map is updated or deleted.
+# Per process like _page_cache, so the same short TTL bounds staleness across workers
+_map_cache = _TTLCache(maxsize=1024, ttl=30)
+
+def _invalidate_read_caches():
+    """Forget cached query results after a committed write"""
+    _page_cache.clear()
+
+# Errors that usually mean a dropped or reset connection rather than a bad query.
+# _checkout already discards the connection, so a fresh attempt gets a new one.
+_TRANSIENT_ERRORS = (pyodbc.OperationalError, pyodbc.InterfaceError)
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.1
+
+def _retry_transient(func):
+    """Retry an idempotent read on transient driver errors with exponential backoff.
+    The backoff sleeps the calling thread, so async code must go through the
+    method's *_async (asyncio.to_thread) wrapper"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except _TRANSIENT_ERRORS as e:
+                if attempt == _RETRY_ATTEMPTS - 1:
+                    raise
+                delay = _RETRY_BASE_DELAY * (2 ** attempt)
+                logger.warning(f"Transient database error in {func.__name__}, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+    return wrapper
+
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration settings"""
     server: str = "localhost"
@@ -22,9 +225,267 @@ class DatabaseConfig:
     maps_table: str = "BeismanDB.dbo.beisman"
     entities_table: str = "BeismanDB.dbo.Entities"
     users_table: str = "BeismanDB.dbo.Users"
+    # Select lists may include expressions, e.g.
+    # FORMAT([CreatedDate], 'MM/dd/yyyy hh:mm:ss tt', 'en-US') AS [CreatedDate],
+    # so optional DATETIME columns arrive already formatted by the server
+    maps_columns: str = "[Number], [Drawer], [PropertyDetails]"
+    entities_columns: str = "[EntityID], [EntityName], [BeismanNumber]"
     use_windows_auth: bool = True
     connection_timeout: int = 30
     command_timeout: int = 30
+    pool_size: int = 10
+    pool_min_size: int = 2
+    pool_recycle: int = 1800
+    packet_size: int = 32767
+    # Opt in to CONTAINS for map search when the maps table has a full-text index;
+    # it matches word prefixes, not substrings, in Drawer and PropertyDetails
+    maps_fulltext: bool = False
+
+@dataclass(frozen=True)
+class _Statements:
+    """Fixed SQL texts for one configuration, built once and shared"""
+    user_by_username: str
+    maps_count: str
+    map_by_number: str
+    map_exists: str
+    map_with_entities: str
+    insert_map: str
+    delete_map: str
+    entities_count: str
+    search_entities: str
+    search_entities_fulltext: str
+    fulltext_enabled: str
+    entity_type_column: str
+    entity_types: str
+    entities_by_type: str
+    delete_entity: str
+    entities_for_map: str
+    add_entity: str
+    remove_entity: str
+
+@lru_cache(maxsize=None)
+def _build_statements(config: DatabaseConfig) -> _Statements:
+    """Build the fixed statements for a configuration (cached: DatabaseConfig is frozen)"""
+    maps, entities = config.maps_table, config.entities_table
+    return _Statements(
+        user_by_username=f"SELECT * FROM {config.users_table} WHERE Username = ?",
+        maps_count=f"SELECT COUNT(*) FROM {maps}",
+        map_by_number=f"SELECT TOP 1 {config.maps_columns} FROM {maps} WHERE [Number] = ?",
+        map_exists=f"SELECT TOP 1 1 FROM {maps} WHERE [Number] = ?",
+        # Map row, then its entity names, as two result sets of one batch
+        map_with_entities=f"""
+            SELECT TOP 1 {config.maps_columns} FROM {maps} WHERE [Number] = ?;
+            SELECT [EntityName] FROM {entities} WHERE [BeismanNumber] = ?;
+        """,
+        # Insert only if the tracking number is new; the range lock on the
+        # existence check keeps concurrent inserts of the same number out
+        insert_map=f"""
+            INSERT INTO {maps} ([Number], [Drawer], [PropertyDetails])
+            SELECT ?, ?, ?
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {maps} WITH (UPDLOCK, HOLDLOCK) WHERE [Number] = ?
+            )
+        """,
+        # Delete associated entities, then the map (by Number, not MapID), in one batch;
+        # NOCOUNT leaves the map DELETE's @@ROWCOUNT as the only result set, and
+        # XACT_ABORT makes any error abort the batch and roll back both deletes
+        delete_map=f"""
+            SET NOCOUNT, XACT_ABORT ON;
+            DELETE FROM {entities} WHERE [BeismanNumber] = ?;
+            DELETE FROM {maps} WHERE [Number] = ?;
+            SELECT @@ROWCOUNT;
+        """,
+        entities_count=f"SELECT COUNT(*) FROM {entities}",
+        search_entities=f"SELECT {config.entities_columns} FROM {entities} WHERE [EntityName] LIKE ? ORDER BY [EntityName]",
+        # Word-prefix match through the full-text index, when the table has one
+        search_entities_fulltext=f"SELECT {config.entities_columns} FROM {entities} WHERE CONTAINS([EntityName], ?) ORDER BY [EntityName]",
+        fulltext_enabled="SELECT OBJECTPROPERTY(OBJECT_ID(?), 'TableHasActiveFulltextIndex')",
+        # EntityType is optional in the schema and not part of entities_columns
+        entity_type_column="SELECT COL_LENGTH(?, 'EntityType')",
+        entity_types=f"SELECT DISTINCT [EntityType] FROM {entities} WHERE [EntityType] <> '' ORDER BY [EntityType]",
+        entities_by_type=f"""
+            SELECT {config.entities_columns}, [EntityType], COUNT(*) OVER () AS [__total_count]
+            FROM {entities} WHERE LOWER([EntityType]) = LOWER(?)
+            ORDER BY [EntityName] OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
+        """,
+        delete_entity=f"DELETE FROM {entities} WHERE [EntityID] = ?",
+        entities_for_map=f"SELECT [EntityName] FROM {entities} WHERE [BeismanNumber] = ?",
+        # Skip pairs the map already has, atomically with the insert
+        add_entity=f"""
+            INSERT INTO {entities} ([BeismanNumber], [EntityName])
+            SELECT ?, ?
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {entities} WITH (UPDLOCK, HOLDLOCK)
+                WHERE [BeismanNumber] = ? AND [EntityName] = ?
+            )
+        """,
+        remove_entity=f"DELETE FROM {entities} WHERE [BeismanNumber] = ? AND [EntityName] = ?",
+    )
+
+@dataclass
+class _PooledConnection:
+    """Live pyodbc connection plus the bookkeeping the pool needs"""
+    connection: Any
+    created_at: float
+    # SQL text -> cursor holding that statement's prepared handle
+    statements: Dict[str, Any] = field(default_factory=dict)
+
+class ConnectionPool:
+    """Bounded LIFO pool of live pyodbc connections for one connection string"""
+
+    def __init__(self, connection_string: str, timeout: int, max_size: int, recycle_seconds: int,
+                 min_size: int = 0):
+        self._connection_string = connection_string
+        self._timeout = timeout
+        self._min_size = min(min_size, max_size)
+        self._recycle_seconds = recycle_seconds
+        self._idle = queue.LifoQueue(maxsize=max_size)
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._checked_out: Dict[int, _PooledConnection] = {}
+        # At most one background refill at a time
+        self._refill_lock = threading.Lock()
+        self._refilling = False
+
+    def _open(self) -> _PooledConnection:
+        logger.debug("Establishing database connection")
+        connection = pyodbc.connect(self._connection_string, timeout=self._timeout)
+        # NVARCHAR data is UTF-16LE on the wire; pin both directions to it so
+        # text is passed through without any re-encoding step
+        connection.setdecoding(pyodbc.SQL_WCHAR, encoding="utf-16le")
+        connection.setencoding(encoding="utf-16le")
+        return _PooledConnection(connection, time.monotonic())
+
+    @staticmethod
+    def _close(pooled: _PooledConnection):
+        try:
+            pooled.connection.close()
+            logger.debug("Database connection closed")
+        except Exception:
+            pass
+
+    @staticmethod
+    def _ping(pooled: _PooledConnection) -> bool:
+        try:
+            pooled.connection.cursor().execute("SELECT 1").fetchone()
+            return True
+        except pyodbc.Error:
+            return False
+
+    def _take_idle(self) -> Optional[_PooledConnection]:
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            # Connections past the recycle age are pinged before reuse
+            age = time.monotonic() - pooled.created_at
+            if age < self._recycle_seconds or self._ping(pooled):
+                return pooled
+            self._close(pooled)
+
+    def acquire(self) -> _PooledConnection:
+        """Check out an idle connection, opening a new one if none is usable"""
+        if not self._slots.acquire(timeout=self._timeout):
+            raise TimeoutError("Timed out waiting for a pooled database connection")
+        try:
+            pooled = self._take_idle() or self._open()
+        except BaseException:
+            self._slots.release()
+            raise
+        self._checked_out[id(pooled.connection)] = pooled
+        return pooled
+
+    def release(self, pooled: _PooledConnection, discard: bool = False):
+        """Return a connection to the pool, or close it if it can't be reused"""
+        self._checked_out.pop(id(pooled.connection), None)
+        try:
+            if discard:
+                self._close(pooled)
+                # Never reconnect on the failing request's own path: during an
+                # outage that would add a second login timeout to every error
+                self._refill_in_background()
+            else:
+                try:
+                    self._idle.put_nowait(pooled)
+                except queue.Full:
+                    self._close(pooled)
+        finally:
+            self._slots.release()
+
+    def _refill(self):
+        """Top idle connections back up to min_size; failures are left for the next acquire"""
+        while self._idle.qsize() < self._min_size:
+            try:
+                self._idle.put_nowait(self._open())
+            except queue.Full:
+                return
+            except pyodbc.Error as e:
+                logger.warning(f"Could not refill connection pool: {e}")
+                return
+
+    def _refill_in_background(self):
+        with self._refill_lock:
+            if self._refilling:
+                return
+            self._refilling = True
+        threading.Thread(target=self._background_refill, name="db-pool-refill", daemon=True).start()
+
+    def _background_refill(self):
+        try:
+            self._refill()
+        finally:
+            with self._refill_lock:
+                self._refilling = False
+
+    def prewarm(self):
+        """Open min_size connections up front so the first requests skip the handshake"""
+        self._refill()
+
+    def statement_cursor(self, connection, sql: str):
+        """Cursor dedicated to one SQL text on a checked-out connection"""
+        statements = self._checked_out[id(connection)].statements
+        cursor = statements.get(sql)
+        if cursor is None:
+            cursor = statements[sql] = connection.cursor()
+        return cursor
+
+    def close_idle(self):
+        """Close every connection currently sitting idle in the pool"""
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(pooled)
+
+# Whether each table has an active full-text index, detected once
+_fulltext_tables: Dict[str, bool] = {}
+
+# Whether each entities table has an EntityType column, detected once
+_entity_type_tables: Dict[str, bool] = {}
+
+# Last known connectivity per connection string: (monotonic time, result)
+CONNECTION_STATUS_TTL = 30.0
+_connection_status: Dict[str, tuple] = {}
+
+# Pools are shared across DatabaseManager instances
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def _get_pool(connection_string: str, config: DatabaseConfig) -> ConnectionPool:
+    """Return the shared pool for a connection string, creating it on first use"""
+    with _pools_lock:
+        pool = _pools.get(connection_string)
+        if pool is None:
+            pool = ConnectionPool(
+                connection_string,
+                timeout=config.connection_timeout,
+                max_size=config.pool_size,
+                recycle_seconds=config.pool_recycle,
+                min_size=config.pool_min_size,
+            )
+            _pools[connection_string] = pool
+        return pool
 
 class DatabaseManager:
     """
@@ -35,11 +496,11 @@ class DatabaseManager:
         """Initialize database manager with configuration"""
         self.config = config or self._load_config_from_env()
         self._connection_string = self._build_connection_string()
+        self._pool = _get_pool(self._connection_string, self.config)
+        self._sql = _build_statements(self.config)
         
-        # Admin user credentials (matches your auth.py)
-        self.admin_users = {
-            "admin": "admin",  # Change this in production!
-        }
+        # Admin user credentials (matches your auth.py), username -> password digest
+        self.admin_users = _ADMIN_PASSWORD_DIGESTS
         
         logger.info("DatabaseManager initialized")
 
@@ -51,9 +512,16 @@ class DatabaseManager:
             maps_table=os.getenv('DB_MAPS_TABLE', 'BeismanDB.dbo.beisman'),
             entities_table=os.getenv('DB_ENTITIES_TABLE', 'BeismanDB.dbo.Entities'),
             users_table=os.getenv('DB_USERS_TABLE', 'BeismanDB.dbo.Users'),
+            maps_columns=os.getenv('DB_MAPS_COLUMNS', '[Number], [Drawer], [PropertyDetails]'),
+            entities_columns=os.getenv('DB_ENTITIES_COLUMNS', '[EntityID], [EntityName], [BeismanNumber]'),
             use_windows_auth=os.getenv('DB_USE_WINDOWS_AUTH', 'true').lower() == 'true',
             connection_timeout=int(os.getenv('DB_CONNECTION_TIMEOUT', '10')),
-            command_timeout=int(os.getenv('DB_COMMAND_TIMEOUT', '30'))
+            command_timeout=int(os.getenv('DB_COMMAND_TIMEOUT', '30')),
+            pool_size=int(os.getenv('DB_POOL_SIZE', '10')),
+            pool_min_size=int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+            pool_recycle=int(os.getenv('DB_POOL_RECYCLE', '1800')),
+            packet_size=int(os.getenv('DB_PACKET_SIZE', '32767')),
+            maps_fulltext=os.getenv('DB_MAPS_FULLTEXT', 'false').lower() == 'true'
         )
 
     def _build_connection_string(self) -> str:
@@ -65,44 +533,81 @@ class DatabaseManager:
                 f"DATABASE={self.config.database};"
                 f"Trusted_Connection=yes;"
                 f"Connection Timeout={self.config.connection_timeout};"
+                f"APP=BeismanMaps;"
+                f"Packet Size={self.config.packet_size};"
             )
         else:
             raise NotImplementedError("SQL Server authentication not implemented")
 
     @contextmanager
-    def get_connection(self):
-        """Context manager for database connections"""
-        connection = None
+    def _checkout(self, autocommit: bool):
+        """Check a connection out of the pool in the requested commit mode"""
         try:
-            logger.debug("Establishing database connection")
-            connection = pyodbc.connect(self._connection_string, timeout=self.config.connection_timeout)
-            connection.autocommit = False
+            pooled = self._pool.acquire()
+        except pyodbc.Error as e:
+            _connection_status[self._connection_string] = (time.monotonic(), False)
+            logger.error(f"Database connection error: {e}")
+            raise
+
+        connection = pooled.connection
+        discard = False
+        try:
+            # Only touch the attribute when the mode actually changes
+            if connection.autocommit != autocommit:
+                connection.autocommit = autocommit
             yield connection
             
         except pyodbc.Error as e:
-            if connection:
-                connection.rollback()
+            # The connection may be broken; never hand it out again
+            discard = True
+            if not autocommit:
+                try:
+                    connection.rollback()
+                except pyodbc.Error:
+                    pass
             logger.error(f"Database connection error: {e}")
             raise
             
         except Exception as e:
-            if connection:
-                connection.rollback()
             logger.error(f"Unexpected database error: {e}")
             raise
+        
+        else:
+            # Work that went through without errors proves the server is reachable,
+            # so connection_ok() needs no extra round-trip for a while
+            _connection_status[self._connection_string] = (time.monotonic(), True)
             
         finally:
-            if connection:
+            if not discard and not autocommit:
+                # Drop any uncommitted work before the connection is reused
                 try:
-                    connection.close()
-                    logger.debug("Database connection closed")
-                except:
-                    pass
+                    connection.rollback()
+                except pyodbc.Error:
+                    discard = True
+            self._pool.release(pooled, discard=discard)
+
+    def get_connection(self):
+        """Context manager for pooled database connections (explicit commit)"""
+        return self._checkout(autocommit=False)
+
+    def get_read_connection(self):
+        """Context manager for read-only queries; autocommit, so no transaction is left open"""
+        return self._checkout(autocommit=True)
+
+    def _execute(self, conn, sql: str, params=()):
+        """Execute on the connection's cursor for this SQL text so its prepared plan is reused.
+
+        Callers must drain the results with fetchall(), otherwise the connection
+        stays busy with them when the next cached cursor executes.
+        """
+        cursor = self._pool.statement_cursor(conn, sql)
+        cursor.execute(sql, params)
+        return cursor
 
     def test_connection(self) -> bool:
         """Test database connectivity"""
         try:
-            with self.get_connection() as conn:
+            with self.get_read_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT 1 as test")
                 result = cursor.fetchone()
@@ -112,29 +617,48 @@ class DatabaseManager:
                     logger.info("Database connection test successful")
                 else:
                     logger.warning("Database connection test failed - no result")
-                    
-                return success
                 
         except Exception as e:
             logger.error(f"Database connection test failed: {e}")
-            return False
+            success = False
+        
+        _connection_status[self._connection_string] = (time.monotonic(), success)
+        return success
+
+    async def test_connection_async(self) -> bool:
+        """test_connection on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.test_connection)
+
+    def connection_ok(self, max_age: float = CONNECTION_STATUS_TTL) -> bool:
+        """Last known connectivity (from test_connection or any successful query)
+        if younger than max_age seconds, else a fresh test"""
+        checked_at, ok = _connection_status.get(self._connection_string, (None, False))
+        if checked_at is not None and time.monotonic() - checked_at < max_age:
+            return ok
+        return self.test_connection()
+
+    async def connection_ok_async(self, max_age: float = CONNECTION_STATUS_TTL) -> bool:
+        """connection_ok on a worker thread (it may run a fresh test_connection)"""
+        return await asyncio.to_thread(self.connection_ok, max_age)
 
     def get_current_timestamp(self) -> str:
-        """Get current timestamp from database server"""
+        """Get current timestamp from database server, formatted server-side"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT GETDATE()")
-                result = cursor.fetchone()
+            with self.get_read_connection() as conn:
+                timestamp = conn.execute("SELECT FORMAT(GETDATE(), 'MM/dd/yyyy, hh:mm:ss tt', 'en-US')").fetchval()
                 
-                if result and result[0]:
-                    return result[0].strftime("%m/%d/%Y, %I:%M:%S %p")
+                if timestamp:
+                    return timestamp
                 else:
-                    return datetime.now().strftime("%m/%d/%Y, %I:%M:%S %p")
+                    return datetime.now().strftime(_TIMESTAMP_FORMAT)
                     
         except Exception as e:
             logger.warning(f"Failed to get database timestamp: {e}")
-            return datetime.now().strftime("%m/%d/%Y, %I:%M:%S %p")
+            return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+    async def get_current_timestamp_async(self) -> str:
+        """get_current_timestamp on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_current_timestamp)
 
     # Authentication Methods (matching your auth.py)
     
@@ -143,15 +667,22 @@ class DatabaseManager:
         if not username or not password:
             return False
             
-        # First try hardcoded credentials
-        is_valid = (username in self.admin_users and 
-                   self.admin_users[username] == password)
+        password_digest = _credential_digest(password)
+        
+        # First try hardcoded credentials (constant-time digest compare)
+        admin_digest = self.admin_users.get(username)
+        is_valid = admin_digest is not None and hmac.compare_digest(admin_digest, password_digest)
         
-        # If not found in hardcoded, try database
+        # If not found in hardcoded, try database (digest cached for an hour)
         if not is_valid:
-            user = self.get_user_by_username(username)
-            if user is not None and hasattr(user, 'PasswordHash'):
-                is_valid = user.PasswordHash == password
+            stored_digest = _credential_cache.get(username)
+            if stored_digest is None:
+                user = self.get_user_by_username(username)
+                if user is not None and getattr(user, 'PasswordHash', None) is not None:
+                    stored_digest = _credential_digest(str(user.PasswordHash))
+                    _credential_cache.put(username, stored_digest)
+            if stored_digest is not None:
+                is_valid = hmac.compare_digest(stored_digest, password_digest)
         
         if is_valid:
             logger.info(f"Valid admin credentials for user: {username}")
@@ -160,28 +691,27 @@ class DatabaseManager:
             
         return is_valid
 
+    async def validate_admin_credentials_async(self, username: str, password: str) -> bool:
+        """validate_admin_credentials on a worker thread (it may query the users table)"""
+        return await asyncio.to_thread(self.validate_admin_credentials, username, password)
+
+    def invalidate_user(self, username: str):
+        """Drop a user's cached credentials (call after a password change or user deletion)"""
+        _credential_cache.pop(username)
+
+    @_retry_transient
     def get_user_by_username(self, username: str):
         """Get user by username from database"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                query = f"SELECT * FROM {self.config.users_table} WHERE Username = ?"
-                cursor.execute(query, [username])
+            with self.get_read_connection() as conn:
+                query = self._sql.user_by_username
+                rows = self._execute(conn, query, [username]).fetchall()
                 
-                columns = [column[0] for column in cursor.description]
-                row = cursor.fetchone()
-                
-                if row:
-                    # Convert row to object-like structure
-                    class UserRecord:
-                        pass
-                    
-                    user = UserRecord()
-                    for i, col in enumerate(columns):
-                        setattr(user, col, row[i])
-                    return user
-                return None
+                # pyodbc rows already expose columns as attributes (user.PasswordHash)
+                return rows[0] if rows else None
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving user {username}: {e}")
             return None
@@ -198,109 +728,108 @@ class DatabaseManager:
             }
         return None
 
+    async def get_user_info_async(self, username: str) -> Optional[Dict[str, Any]]:
+        """get_user_info on a worker thread (it reads the server timestamp)"""
+        return await asyncio.to_thread(self.get_user_info, username)
+
     # Maps Operations (using correct column names: Number, Drawer, PropertyDetails)
     
+    def _beisman_data_sql(self, limit: Optional[int], offset: int) -> tuple[str, list]:
+        # Build query with pagination - ORDER BY Number (not MapID)
+        query = f"SELECT {self.config.maps_columns} FROM {self.config.maps_table} ORDER BY Number OFFSET ? ROWS"
+        params = [offset]
+        
+        if limit is not None:
+            query += " FETCH NEXT ? ROWS ONLY"
+            params.append(limit)
+        return query, params
+
+    @_retry_transient
     def get_beisman_data(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
         """Retrieve maps data with pagination - matches Streamlit method signature"""
+        return self._beisman_page(limit, offset)
+
+    def _beisman_page(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """get_beisman_data without the retry, for callers that already retry"""
+        # Module-level cache keyed by arguments only, so per-request instances share it
+        cache_key = ("beisman", self.config.maps_table, limit, offset)
+        cached = _page_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Build query with pagination - ORDER BY Number (not MapID)
-                query = f"SELECT * FROM {self.config.maps_table} ORDER BY Number OFFSET ? ROWS"
-                params = [offset]
-                
-                if limit is not None:
-                    query += " FETCH NEXT ? ROWS ONLY"
-                    params.append(limit)
-                
-                cursor.execute(query, params)
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Convert to list of dictionaries
-                maps_data = []
-                for row in rows:
-                    map_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in map_dict.items():
-                        if isinstance(value, datetime):
-                            map_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            map_dict[key] = ""
-                    maps_data.append(map_dict)
+            with self.get_read_connection() as conn:
+                query, params = self._beisman_data_sql(limit, offset)
+                cursor = self._execute(conn, query, params)
+                maps_data = _rows_to_dicts(cursor, cache_key=query)
                 
                 logger.info(f"Retrieved {len(maps_data)} maps")
+                _page_cache.put(cache_key, maps_data)
                 return maps_data
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving maps data: {e}")
             return []
 
+    def iter_beisman_data(self, limit: Optional[int] = None, offset: int = 0,
+                          chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream maps without materializing the whole table (used by CSV export)"""
+        query, params = self._beisman_data_sql(limit, offset)
+        return self._stream(query, params, chunk_size)
+
+    @_retry_transient
     def get_beisman_data_count(self) -> int:
         """Get the total number of records in the beisman table"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                query = f"SELECT COUNT(*) FROM {self.config.maps_table}"
-                cursor.execute(query)
-                result = cursor.fetchone()
-                return result[0] if result else 0
+            with self.get_read_connection() as conn:
+                # Scalar on a throwaway cursor: fetchval() leaves the result open,
+                # which a cached statement cursor must not do
+                return conn.execute(self._sql.maps_count).fetchval() or 0
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error getting maps count: {e}")
             return 0
 
+    async def get_beisman_data_count_async(self) -> int:
+        """get_beisman_data_count on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_beisman_data_count)
+
+    @_retry_transient
     def get_maps_data(self, limit: int = 50, offset: int = 0, 
                      search_term: Optional[str] = None) -> Dict[str, Any]:
         """FastAPI-compatible maps data retrieval"""
+        cache_key = ("maps", self.config.maps_table, limit, offset, search_term)
+        cached = _page_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
+            with self.get_read_connection() as conn:
                 # Build query with optional search
-                base_query = f"SELECT * FROM {self.config.maps_table}"
+                base_query = f"SELECT {self.config.maps_columns}, COUNT(*) OVER () AS [__total_count] FROM {self.config.maps_table}"
                 count_query = f"SELECT COUNT(*) FROM {self.config.maps_table}"
                 params = []
                 
                 if search_term:
-                    # Use exact column names from your Streamlit code
-                    search_condition = """
-                        WHERE [Number] LIKE ? 
-                        OR [Drawer] LIKE ? 
-                        OR [PropertyDetails] LIKE ?
-                    """
+                    search_condition, params = self._maps_search_predicate(search_term, conn)
                     base_query += search_condition
                     count_query += search_condition
-                    
-                    search_pattern = f"%{search_term}%"
-                    params = [search_pattern, search_pattern, search_pattern]
                 
                 # Add ordering and pagination using Number (not MapID)
                 base_query += " ORDER BY [Number] OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
                 params.extend([offset, limit])
                 
-                # Get total count
-                count_params = params[:-2] if search_term else []
-                cursor.execute(count_query, count_params)
-                total_count = cursor.fetchone()[0]
-                
-                # Get paginated data
-                cursor.execute(base_query, params)
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Convert to list of dictionaries
-                maps_data = []
-                for row in rows:
-                    map_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in map_dict.items():
-                        if isinstance(value, datetime):
-                            map_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            map_dict[key] = ""
-                    maps_data.append(map_dict)
+                # Page rows and total count in one round trip
+                cursor = self._execute(conn, base_query, params)
+                maps_data, total_count = _page_rows_to_dicts(cursor, cache_key=base_query)
+                if total_count is None:
+                    # Empty page: only past the last page can there still be matching rows
+                    count_params = params[:-2] if search_term else []
+                    total_count = self._execute(conn, count_query, count_params).fetchall()[0][0] if offset > 0 else 0
                 
                 # Calculate pagination info
                 total_pages = (total_count + limit - 1) // limit
@@ -316,90 +845,172 @@ class DatabaseManager:
                 }
                 
                 logger.info(f"Retrieved {len(maps_data)} maps (page {current_page}/{total_pages})")
+                _page_cache.put(cache_key, result)
                 return result
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving maps data: {e}")
             return {"data": [], "total_count": 0, "current_page": 1, "total_pages": 0, "has_next": False, "has_previous": False}
 
+    async def get_maps_data_async(self, limit: int = 50, offset: int = 0,
+                                  search_term: Optional[str] = None) -> Dict[str, Any]:
+        """get_maps_data on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_maps_data, limit, offset, search_term)
+
+    @_retry_transient
     def get_map_by_track_number(self, track_number: int) -> Optional[Dict[str, Any]]:
         """Get map details by track number - matches Streamlit method"""
+        cache_key = (self.config.maps_table, track_number)
+        cached = _map_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                query = f"SELECT * FROM {self.config.maps_table} WHERE [Number] = ?"
-                cursor.execute(query, [track_number])
-                
-                columns = [column[0] for column in cursor.description]
-                row = cursor.fetchone()
-                
-                if row:
-                    map_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in map_dict.items():
-                        if isinstance(value, datetime):
-                            map_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            map_dict[key] = ""
+            with self.get_read_connection() as conn:
+                query = self._sql.map_by_number
+                cursor = self._execute(conn, query, [track_number])
+                
+                # fetchall() drains the result so the cached cursor can be reused
+                rows = cursor.fetchall()
+                
+                if rows:
+                    map_dict = _rows_to_dicts(cursor, rows, cache_key=query)[0]
                     
                     logger.debug(f"Retrieved map {track_number}")
+                    _map_cache.put(cache_key, map_dict)
                     return map_dict
                 
                 logger.debug(f"Map {track_number} not found")
                 return None
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving map {track_number}: {e}")
             return None
 
+    async def get_map_by_track_number_async(self, track_number: str) -> Optional[Dict[str, Any]]:
+        """get_map_by_track_number on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_map_by_track_number, track_number)
+
+    @_retry_transient
+    def get_map_with_entities(self, track_number: str) -> tuple[Optional[Dict[str, Any]], List[str]]:
+        """Get a map and its entity names in one round-trip; (None, []) if the map doesn't exist"""
+        try:
+            with self.get_read_connection() as conn:
+                query = self._sql.map_with_entities
+                cursor = self._execute(conn, query, [track_number, track_number])
+                
+                rows, description = cursor.fetchall(), cursor.description
+                # Drain the second result set too so the cached cursor can be reused
+                entity_names = [entity_name for (entity_name,) in cursor.fetchall()] if cursor.nextset() else []
+                
+                if not rows:
+                    logger.debug(f"Map {track_number} not found")
+                    return None, []
+                
+                map_dict = _rows_to_dicts(cursor, rows, description=description, cache_key=self._sql.map_by_number)[0]
+                _map_cache.put((self.config.maps_table, track_number), map_dict)
+                logger.debug(f"Retrieved map {track_number} with {len(entity_names)} entities")
+                return map_dict, entity_names
+                
+        except _TRANSIENT_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving map {track_number} with entities: {e}")
+            return None, []
+
+    async def get_map_with_entities_async(self, track_number: str) -> tuple[Optional[Dict[str, Any]], List[str]]:
+        """get_map_with_entities on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_map_with_entities, track_number)
+
+    @_retry_transient
+    def map_exists(self, track_number: str) -> bool:
+        """Check whether a map exists without fetching its columns"""
+        try:
+            with self.get_read_connection() as conn:
+                return bool(self._execute(conn, self._sql.map_exists, [track_number]).fetchall())
+                
+        except _TRANSIENT_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error checking map {track_number}: {e}")
+            return False
+
+    async def map_exists_async(self, track_number: str) -> bool:
+        """map_exists on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.map_exists, track_number)
+
     def get_map_by_id(self, map_number: int) -> Optional[Dict[str, Any]]:
         """Alias for get_map_by_track_number for FastAPI compatibility"""
         return self.get_map_by_track_number(map_number)
 
-    def search_maps(self, search_term: str) -> List[Dict[str, Any]]:
-        """Search for maps based on search term - matches Streamlit method"""
+    def _maps_search_predicate(self, search_term: str, conn=None) -> tuple[str, list]:
+        """Full-text predicate when the maps table supports it, else the LIKE scan.
+
+        Full-text is opt-in (DB_MAPS_FULLTEXT=true) because Drawer and PropertyDetails
+        then match words starting with the term ("hill" finds "Hillside" but not
+        "Foothills") instead of substrings. Without a connection only an
+        already-detected index is used.
+        """
+        if (self.config.maps_fulltext and search_term == search_term.strip()
+                and self._fulltext_enabled(conn, self.config.maps_table)):
+            return _MAPS_FULLTEXT_PREDICATE, [_contains_term(search_term), f"%{search_term}%"]
+        return _search_predicate(_MAPS_SEARCH_COLUMNS, search_term)
+
+    def _search_maps_sql(self, search_term: str, limit: Optional[int] = None, offset: int = 0,
+                         conn=None) -> tuple[str, list]:
+        search_condition, params = self._maps_search_predicate(search_term, conn)
+        query = f"SELECT {self.config.maps_columns} FROM {self.config.maps_table}{search_condition} ORDER BY [Number]"
+        if limit is not None:
+            query += " OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
+            params = params + [offset, limit]
+        return query, params
+
+    def _stream(self, query: str, params: list, chunk_size: int) -> Iterator[Dict[str, Any]]:
+        """Yield query rows one fetchmany() batch at a time"""
+        with self.get_read_connection() as conn:
+            # A dedicated cursor, not a cached statement one: a stream abandoned
+            # part-way is closed here instead of leaving results pending
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+                while True:
+                    batch = cursor.fetchmany(chunk_size)
+                    if not batch:
+                        return
+                    yield from _rows_to_dicts(cursor, batch, cache_key=query)
+            finally:
+                cursor.close()
+
+    @_retry_transient
+    def search_maps(self, search_term: str, limit: int = 500, offset: int = 0) -> List[Dict[str, Any]]:
+        """Search for maps based on search term, one page of at most `limit` rows"""
         if not search_term or not search_term.strip():
-            return self.get_beisman_data()
+            return self._beisman_page(limit, offset)
         
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Search across all text columns
-                query = f"""
-                    SELECT * FROM {self.config.maps_table} 
-                    WHERE CAST([Number] AS VARCHAR) LIKE ? 
-                    OR [Drawer] LIKE ? 
-                    OR [PropertyDetails] LIKE ?
-                    ORDER BY [Number]
-                """
-                
-                search_pattern = f"%{search_term}%"
-                params = [search_pattern, search_pattern, search_pattern]
-                
-                cursor.execute(query, params)
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Convert to list of dictionaries
-                maps_data = []
-                for row in rows:
-                    map_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in map_dict.items():
-                        if isinstance(value, datetime):
-                            map_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            map_dict[key] = ""
-                    maps_data.append(map_dict)
+            with self.get_read_connection() as conn:
+                query, params = self._search_maps_sql(search_term, limit, offset, conn)
+                cursor = self._execute(conn, query, params)
+                maps_data = _rows_to_dicts(cursor, cache_key=query)
                 
                 logger.info(f"Search returned {len(maps_data)} maps for term: {search_term}")
                 return maps_data
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error searching maps: {e}")
             return []
 
+    def iter_search_maps(self, search_term: str, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream search results without materializing the whole result set (used by CSV export)"""
+        query, params = self._search_maps_sql(search_term)
+        return self._stream(query, params, chunk_size)
+
     def insert_map(self, map_data: Dict[str, Any]) -> bool:
         """Insert a new map record - compatible with both Streamlit and FastAPI"""
         try:
@@ -422,29 +1033,26 @@ class DatabaseManager:
                 if not trace_number:
                     raise ValueError("Trace number is required")
                 
-                # Check if the tracking number already exists
-                existing = self.get_map_by_track_number(trace_number)
-                if existing:
-                    logger.warning(f"Tracking number {trace_number} already exists")
-                    return False
-                
-                # Insert with correct column names
-                query = f"INSERT INTO {self.config.maps_table} ([Number], [Drawer], [PropertyDetails]) VALUES (?, ?, ?)"
-                cursor.execute(query, [trace_number, drawer or '', description or ''])
+                cursor.setinputsizes(_INSERT_MAP_SIZES)
+                cursor.execute(self._sql.insert_map, [trace_number, drawer or '', description or '', trace_number])
+                inserted = cursor.rowcount == 1
                 conn.commit()
+                _invalidate_read_caches()
                 
-                # Verify the insertion
-                if self.get_map_by_track_number(trace_number):
+                if inserted:
                     logger.info(f"Successfully inserted new map: {trace_number}")
-                    return True
                 else:
-                    logger.error("Failed to verify map insertion")
-                    return False
+                    logger.warning(f"Tracking number {trace_number} already exists")
+                return inserted
                     
         except Exception as e:
             logger.error(f"Error inserting map: {e}")
             return False
 
+    async def insert_map_async(self, map_data: Dict[str, Any]) -> bool:
+        """insert_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.insert_map, map_data)
+
     def update_map(self, map_number: int, map_data: Dict[str, Any]) -> bool:
         """Update an existing map record"""
         try:
@@ -454,14 +1062,17 @@ class DatabaseManager:
                 # Build dynamic UPDATE query using correct column names
                 update_fields = []
                 values = []
+                sizes = []
                 
                 if 'Drawer' in map_data:
                     update_fields.append('[Drawer] = ?')
                     values.append(map_data['Drawer'])
+                    sizes.append(_DRAWER_PARAM)
                 
                 if 'PropertyDetails' in map_data or 'Description' in map_data:
                     update_fields.append('[PropertyDetails] = ?')
                     values.append(map_data.get('PropertyDetails') or map_data.get('Description'))
+                    sizes.append(_DETAILS_PARAM)
                 
                 if not update_fields:
                     logger.warning("No valid data provided for map update")
@@ -469,10 +1080,14 @@ class DatabaseManager:
                 
                 query = f"UPDATE {self.config.maps_table} SET {', '.join(update_fields)} WHERE [Number] = ?"
                 values.append(map_number)
+                sizes.append(_NUMBER_PARAM)
                 
+                cursor.setinputsizes(sizes)
                 cursor.execute(query, values)
                 rows_affected = cursor.rowcount
                 conn.commit()
+                _invalidate_read_caches()
+                _map_cache.pop((self.config.maps_table, map_number))
                 
                 success = rows_affected > 0
                 if success:
@@ -486,19 +1101,22 @@ class DatabaseManager:
             logger.error(f"Error updating map {map_number}: {e}")
             return False
 
+    async def update_map_async(self, map_number: int, map_data: Dict[str, Any]) -> bool:
+        """update_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.update_map, map_number, map_data)
+
     def delete_map(self, map_number: int) -> bool:
         """Delete a map record"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # First, delete associated entities
-                cursor.execute(f"DELETE FROM {self.config.entities_table} WHERE [BeismanNumber] = ?", [map_number])
-                
-                # Then, delete the map using Number (not MapID)
-                cursor.execute(f"DELETE FROM {self.config.maps_table} WHERE [Number] = ?", [map_number])
-                rows_affected = cursor.rowcount
+                # Entities and map deleted in one batch returning the map's row count
+                cursor.execute(self._sql.delete_map, [map_number, map_number])
+                rows_affected = cursor.fetchval()
                 conn.commit()
+                _invalidate_read_caches()
+                _map_cache.pop((self.config.maps_table, map_number))
                 
                 success = rows_affected > 0
                 if success:
@@ -512,102 +1130,99 @@ class DatabaseManager:
             logger.error(f"Error deleting map {map_number}: {e}")
             return False
 
+    async def delete_map_async(self, map_number: int) -> bool:
+        """delete_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.delete_map, map_number)
+
     # Entity Operations (using correct column names: EntityName, BeismanNumber)
     
+    def _all_entities_sql(self, limit: Optional[int], offset: int) -> tuple[str, list]:
+        query = f"SELECT {self.config.entities_columns} FROM {self.config.entities_table} ORDER BY [EntityName] OFFSET ? ROWS"
+        params = [offset]
+        
+        if limit is not None:
+            query += " FETCH NEXT ? ROWS ONLY"
+            params.append(limit)
+        return query, params
+
+    @_retry_transient
     def get_all_entities(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
         """Get all entities from the database - matches Streamlit method"""
+        return self._all_entities_page(limit, offset)
+
+    def _all_entities_page(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """get_all_entities without the retry, for callers that already retry"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = f"SELECT * FROM {self.config.entities_table} ORDER BY [EntityName] OFFSET ? ROWS"
-                params = [offset]
-                
-                if limit is not None:
-                    query += " FETCH NEXT ? ROWS ONLY"
-                    params.append(limit)
-                    
-                cursor.execute(query, params)
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Convert to list of dictionaries
-                entities_data = []
-                for row in rows:
-                    entity_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in entity_dict.items():
-                        if isinstance(value, datetime):
-                            entity_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            entity_dict[key] = ""
-                    entities_data.append(entity_dict)
+            with self.get_read_connection() as conn:
+                query, params = self._all_entities_sql(limit, offset)
+                cursor = self._execute(conn, query, params)
+                entities_data = _rows_to_dicts(cursor, cache_key=query)
                 
                 logger.info(f"Retrieved {len(entities_data)} entities")
                 return entities_data
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving entities: {e}")
             return []
 
+    def iter_all_entities(self, limit: Optional[int] = None, offset: int = 0,
+                          chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream entities without materializing the whole table (used by CSV export)"""
+        query, params = self._all_entities_sql(limit, offset)
+        return self._stream(query, params, chunk_size)
+
+    @_retry_transient
     def get_entities_count(self) -> int:
         """Get the total number of entities in the database"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                query = f"SELECT COUNT(*) FROM {self.config.entities_table}"
-                cursor.execute(query)
-                result = cursor.fetchone()
-                return result[0] if result else 0
+            with self.get_read_connection() as conn:
+                # Scalar on a throwaway cursor: fetchval() leaves the result open,
+                # which a cached statement cursor must not do
+                return conn.execute(self._sql.entities_count).fetchval() or 0
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error getting entities count: {e}")
             return 0
 
+    async def get_entities_count_async(self) -> int:
+        """get_entities_count on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_entities_count)
+
+    @_retry_transient
     def get_entities_data(self, limit: int = 50, offset: int = 0, 
                          search_term: Optional[str] = None) -> Dict[str, Any]:
         """FastAPI-compatible entities data retrieval"""
+        cache_key = ("entities", self.config.entities_table, limit, offset, search_term)
+        cached = _page_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
+            with self.get_read_connection() as conn:
                 # Build query with optional search
-                base_query = f"SELECT * FROM {self.config.entities_table}"
+                base_query = f"SELECT {self.config.entities_columns}, COUNT(*) OVER () AS [__total_count] FROM {self.config.entities_table}"
                 count_query = f"SELECT COUNT(*) FROM {self.config.entities_table}"
                 params = []
                 
                 if search_term:
-                    search_condition = " WHERE [EntityName] LIKE ? OR CAST([BeismanNumber] AS VARCHAR) LIKE ?"
+                    search_condition, params = _search_predicate(_ENTITIES_SEARCH_COLUMNS, search_term)
                     base_query += search_condition
                     count_query += search_condition
-                    
-                    search_pattern = f"%{search_term}%"
-                    params = [search_pattern, search_pattern]
                 
                 # Add ordering and pagination
                 base_query += " ORDER BY [EntityName] OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
                 params.extend([offset, limit])
                 
-                # Get total count
-                count_params = params[:-2] if search_term else []
-                cursor.execute(count_query, count_params)
-                total_count = cursor.fetchone()[0]
-                
-                # Get paginated data
-                cursor.execute(base_query, params)
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Convert to list of dictionaries
-                entities_data = []
-                for row in rows:
-                    entity_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in entity_dict.items():
-                        if isinstance(value, datetime):
-                            entity_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            entity_dict[key] = ""
-                    entities_data.append(entity_dict)
+                # Page rows and total count in one round trip
+                cursor = self._execute(conn, base_query, params)
+                entities_data, total_count = _page_rows_to_dicts(cursor, cache_key=base_query)
+                if total_count is None:
+                    # Empty page: only past the last page can there still be matching rows
+                    count_params = params[:-2] if search_term else []
+                    total_count = self._execute(conn, count_query, count_params).fetchall()[0][0] if offset > 0 else 0
                 
                 # Calculate pagination info
                 total_pages = (total_count + limit - 1) // limit
@@ -623,47 +1238,121 @@ class DatabaseManager:
                 }
                 
                 logger.info(f"Retrieved {len(entities_data)} entities (page {current_page}/{total_pages})")
+                _page_cache.put(cache_key, result)
                 return result
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving entities data: {e}")
             return {"data": [], "total_count": 0, "current_page": 1, "total_pages": 0, "has_next": False, "has_previous": False}
 
+    async def get_entities_data_async(self, limit: int = 50, offset: int = 0,
+                                      search_term: Optional[str] = None) -> Dict[str, Any]:
+        """get_entities_data on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_entities_data, limit, offset, search_term)
+
+    def _fulltext_enabled(self, conn, table: str) -> bool:
+        """Whether a table has an active full-text index (checked once per table)"""
+        enabled = _fulltext_tables.get(table)
+        if enabled is None:
+            if conn is None:
+                return False
+            try:
+                enabled = bool(conn.execute(self._sql.fulltext_enabled, [table]).fetchval())
+            except pyodbc.Error as e:
+                logger.warning(f"Could not check full-text index on {table}: {e}")
+                enabled = False
+            _fulltext_tables[table] = enabled
+            logger.info(f"Full-text search on {table}: {'enabled' if enabled else 'disabled'}")
+        return enabled
+
+    def _has_entity_type(self, conn) -> bool:
+        """Whether the entities table has an EntityType column (checked once per table)"""
+        table = self.config.entities_table
+        present = _entity_type_tables.get(table)
+        if present is None:
+            present = conn.execute(self._sql.entity_type_column, [table]).fetchval() is not None
+            _entity_type_tables[table] = present
+        return present
+
+    @_retry_transient
+    def get_entity_types(self) -> Optional[List[str]]:
+        """Distinct non-empty entity types; None if the table has no EntityType column"""
+        try:
+            with self.get_read_connection() as conn:
+                if not self._has_entity_type(conn):
+                    return None
+                cursor = self._execute(conn, self._sql.entity_types)
+                return [entity_type for (entity_type,) in cursor.fetchall()]
+                
+        except _TRANSIENT_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting entity types: {e}")
+            return []
+
+    async def get_entity_types_async(self) -> Optional[List[str]]:
+        """get_entity_types on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_entity_types)
+
+    @_retry_transient
+    def get_entities_by_type(self, entity_type: str, limit: int = 50,
+                             offset: int = 0) -> Optional[Dict[str, Any]]:
+        """One page of entities of a type (case-insensitive) with the total match count;
+        None if the table has no EntityType column"""
+        try:
+            with self.get_read_connection() as conn:
+                if not self._has_entity_type(conn):
+                    return None
+                query = self._sql.entities_by_type
+                cursor = self._execute(conn, query, [entity_type, offset, limit])
+                entities_data, total_count = _page_rows_to_dicts(cursor, cache_key=query)
+                return {"data": entities_data, "total_count": total_count or 0}
+                
+        except _TRANSIENT_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting entities of type {entity_type}: {e}")
+            return {"data": [], "total_count": 0}
+
+    async def get_entities_by_type_async(self, entity_type: str, limit: int = 50,
+                                         offset: int = 0) -> Optional[Dict[str, Any]]:
+        """get_entities_by_type on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_entities_by_type, entity_type, limit, offset)
+
+    @_retry_transient
     def search_entities(self, search_term: str) -> List[Dict[str, Any]]:
         """Search for entities based on entity name - matches Streamlit method"""
         if not search_term or not search_term.strip():
-            return self.get_all_entities()
+            return self._all_entities_page(50, 0)
         
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = f"SELECT * FROM {self.config.entities_table} WHERE [EntityName] LIKE ? ORDER BY [EntityName]"
-                search_pattern = f"%{search_term}%"
-                
-                cursor.execute(query, [search_pattern])
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
+            with self.get_read_connection() as conn:
+                if search_term == search_term.strip() and self._fulltext_enabled(conn, self.config.entities_table):
+                    query = self._sql.search_entities_fulltext
+                    search_pattern = _contains_term(search_term)
+                else:
+                    # Leading wildcard: no index can help, so this scans
+                    query = self._sql.search_entities
+                    search_pattern = f"%{search_term}%"
                 
-                # Convert to list of dictionaries
-                entities_data = []
-                for row in rows:
-                    entity_dict = dict(zip(columns, row))
-                    # Convert datetime objects to strings
-                    for key, value in entity_dict.items():
-                        if isinstance(value, datetime):
-                            entity_dict[key] = value.strftime("%m/%d/%Y %I:%M:%S %p")
-                        elif value is None:
-                            entity_dict[key] = ""
-                    entities_data.append(entity_dict)
+                cursor = self._execute(conn, query, [search_pattern])
+                entities_data = _rows_to_dicts(cursor, cache_key=query)
                 
                 logger.info(f"Search returned {len(entities_data)} entities for term: {search_term}")
                 return entities_data
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error searching entities: {e}")
             return []
 
+    async def search_entities_async(self, search_term: str) -> List[Dict[str, Any]]:
+        """search_entities on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.search_entities, search_term)
+
     def delete_entity(self, entity_id: int) -> bool:
         """Delete an entity record"""
         try:
@@ -671,9 +1360,10 @@ class DatabaseManager:
                 cursor = conn.cursor()
                 
                 # Note: This assumes EntityID exists. If not, we might need to delete by EntityName + BeismanNumber
-                cursor.execute(f"DELETE FROM {self.config.entities_table} WHERE [EntityID] = ?", [entity_id])
+                cursor.execute(self._sql.delete_entity, [entity_id])
                 rows_affected = cursor.rowcount
                 conn.commit()
+                _invalidate_read_caches()
                 
                 success = rows_affected > 0
                 if success:
@@ -687,40 +1377,83 @@ class DatabaseManager:
             logger.error(f"Error deleting entity {entity_id}: {e}")
             return False
 
-    def get_entities_for_map(self, track_number: int) -> List[Dict[str, Any]]:
+    async def delete_entity_async(self, entity_id: int) -> bool:
+        """delete_entity on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.delete_entity, entity_id)
+
+    @_retry_transient
+    def get_entities_for_map(self, track_number: int) -> List[str]:
         """Get all entities for a given map"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = f"SELECT [EntityName] FROM {self.config.entities_table} WHERE [BeismanNumber] = ?"
-                cursor.execute(query, [track_number])
-                
-                columns = [column[0] for column in cursor.description]
-                rows = cursor.fetchall()
-                
-                # Convert to list of dictionaries
-                entities_data = []
-                for row in rows:
-                    entity_dict = dict(zip(columns, row))
-                    entities_data.append(entity_dict)
+            with self.get_read_connection() as conn:
+                query = self._sql.entities_for_map
+                cursor = self._execute(conn, query, [track_number])
                 
-                return entities_data
+                # Single-column result: just the names, one bulk fetch
+                return [entity_name for (entity_name,) in cursor.fetchall()]
                 
+        except _TRANSIENT_ERRORS:
+            raise
         except Exception as e:
             logger.error(f"Error getting entities for map {track_number}: {e}")
             return []
 
+    async def get_entities_for_map_async(self, track_number: str) -> List[str]:
+        """get_entities_for_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_entities_for_map, track_number)
+
+    @_retry_transient
+    def get_entities_for_maps(self, track_numbers: List[str]) -> Dict[str, List[str]]:
+        """Get entity names for several maps in one query per 2000 numbers"""
+        entities_by_map: Dict[str, List[str]] = {number: [] for number in track_numbers}
+        if not entities_by_map:
+            return entities_by_map
+        
+        numbers = list(entities_by_map)
+        try:
+            with self.get_read_connection() as conn:
+                # Plain cursor: the statement text varies with the number of placeholders
+                cursor = conn.cursor()
+                setdefault = entities_by_map.setdefault
+                # SQL Server accepts at most 2100 parameters per statement
+                for start in range(0, len(numbers), _MAX_IN_PARAMS):
+                    chunk = numbers[start:start + _MAX_IN_PARAMS]
+                    cursor.execute(
+                        f"SELECT [BeismanNumber], [EntityName] FROM {self.config.entities_table} "
+                        f"WHERE [BeismanNumber] IN ({_placeholders(len(chunk))})",
+                        chunk
+                    )
+                    for beisman_number, entity_name in cursor.fetchall():
+                        setdefault(beisman_number, []).append(entity_name)
+                
+                return entities_by_map
+                
+        except _TRANSIENT_ERRORS:
+            raise
+        except Exception as e:
+            logger.error(f"Error getting entities for maps: {e}")
+            return {number: [] for number in numbers}
+
+    async def get_entities_for_maps_async(self, track_numbers: List[str]) -> Dict[str, List[str]]:
+        """get_entities_for_maps on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.get_entities_for_maps, track_numbers)
+
     def add_entity_to_map(self, track_number: int, entity_name: str) -> tuple[bool, str]:
         """Add a new entity for a map"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute(f"INSERT INTO {self.config.entities_table} ([BeismanNumber], [EntityName]) VALUES (?, ?)",
-                              [track_number, entity_name])
+                # Skip pairs the map already has, atomically with the insert
+                cursor.setinputsizes(_ENTITY_PAIR_SIZES)
+                cursor.execute(self._sql.add_entity, [track_number, entity_name, track_number, entity_name])
+                inserted = cursor.rowcount == 1
                 conn.commit()
                 
+                if not inserted:
+                    return False, "Entity already exists for this map."
+                _invalidate_read_caches()
+                
                 logger.info(f"Successfully added entity {entity_name} to map {track_number}")
                 return True, "Entity added successfully."
                 
@@ -728,16 +1461,21 @@ class DatabaseManager:
             logger.error(f"Error adding entity: {e}")
             return False, f"Error adding entity: {str(e)}"
 
+    async def add_entity_to_map_async(self, track_number: int, entity_name: str) -> tuple[bool, str]:
+        """add_entity_to_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.add_entity_to_map, track_number, entity_name)
+
     def remove_entity_from_map(self, track_number: int, entity_name: str) -> tuple[bool, str]:
         """Remove an entity associated with a map"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute(f"DELETE FROM {self.config.entities_table} WHERE [BeismanNumber] = ? AND [EntityName] = ?",
-                              [track_number, entity_name])
+                cursor.setinputsizes(_ENTITY_PAIR_SIZES[:2])
+                cursor.execute(self._sql.remove_entity, [track_number, entity_name])
                 rows_affected = cursor.rowcount
                 conn.commit()
+                _invalidate_read_caches()
                 
                 if rows_affected > 0:
                     logger.info(f"Successfully removed entity {entity_name} from map {track_number}")
@@ -749,10 +1487,87 @@ class DatabaseManager:
             logger.error(f"Error removing entity: {e}")
             return False, f"Error removing entity: {str(e)}"
 
+    async def remove_entity_from_map_async(self, track_number: int, entity_name: str) -> tuple[bool, str]:
+        """remove_entity_from_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.remove_entity_from_map, track_number, entity_name)
+
+    def add_entities_to_map(self, track_number: str, entity_names: List[str]) -> tuple[int, List[str], str]:
+        """Add several entities to a map in one transaction.
+        Returns (added count, names the map already had, message)"""
+        # Duplicates within the request would pass the NOT EXISTS check together
+        names = list(dict.fromkeys(name for name in entity_names if name))
+        if not names:
+            return 0, [], "No entity names provided."
+        
+        entities = self.config.entities_table
+        try:
+            with self.get_connection() as conn:
+                # Plain cursor: the statement text varies with the number of placeholders
+                cursor = conn.cursor()
+                added, skipped = 0, []
+                # The map number takes one of the parameters in each chunk
+                for start in range(0, len(names), _MAX_IN_PARAMS - 1):
+                    chunk = names[start:start + _MAX_IN_PARAMS - 1]
+                    # Range-lock the pairs the map already has, so the insert below
+                    # and this list agree until commit
+                    cursor.execute(*_existing_entities_sql(entities, track_number, chunk))
+                    skipped.extend(entity_name for (entity_name,) in cursor.fetchall())
+                    
+                    cursor.execute(*_insert_entities_sql(entities, track_number, chunk))
+                    added += cursor.rowcount
+                conn.commit()
+                if added:
+                    _invalidate_read_caches()
+                
+                logger.info(f"Added {added} entities to map {track_number}, {len(skipped)} already present")
+                if not added:
+                    return 0, skipped, "All entities are already associated with this map."
+                return added, skipped, "Entities added successfully."
+                
+        except Exception as e:
+            logger.error(f"Error adding entities: {e}")
+            return 0, [], f"Error adding entities: {str(e)}"
+
+    async def add_entities_to_map_async(self, track_number: str, entity_names: List[str]) -> tuple[int, List[str], str]:
+        """add_entities_to_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.add_entities_to_map, track_number, entity_names)
+
+    def remove_entities_from_map(self, track_number: str, entity_names: List[str]) -> tuple[int, str]:
+        """Remove several entities from a map in one transaction; returns (removed count, message)"""
+        names = list(dict.fromkeys(name for name in entity_names if name))
+        if not names:
+            return 0, "No entity names provided."
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                removed = 0
+                # One DELETE per chunk; the map number takes one of the parameters
+                for start in range(0, len(names), _MAX_IN_PARAMS - 1):
+                    chunk = names[start:start + _MAX_IN_PARAMS - 1]
+                    cursor.execute(*_remove_entities_sql(self.config.entities_table, track_number, chunk))
+                    removed += cursor.rowcount
+                conn.commit()
+                _invalidate_read_caches()
+                
+                logger.info(f"Removed {removed} entities from map {track_number}")
+                return removed, "Entities removed successfully." if removed else "Entities not found."
+                
+        except Exception as e:
+            logger.error(f"Error removing entities: {e}")
+            return 0, f"Error removing entities: {str(e)}"
+
+    async def remove_entities_from_map_async(self, track_number: str, entity_names: List[str]) -> tuple[int, str]:
+        """remove_entities_from_map on a worker thread, so async endpoints don't block the event loop"""
+        return await asyncio.to_thread(self.remove_entities_from_map, track_number, entity_names)
+
+    def prewarm_pool(self):
+        """Open the pool's minimum number of connections ahead of the first request"""
+        self._pool.prewarm()
+
     def close_connection(self):
-        """Close database connection - compatibility method"""
-        # This is handled by context managers, but keeping for compatibility
-        pass
+        """Close idle pooled connections (called on application shutdown)"""
+        self._pool.close_idle()
 
 # Create a global instance
 db_manager = DatabaseManager()
@@ -7,56 +7,62 @@ Migrated from Streamlit to FastAPI + HTML/CSS - Replicating exact navigation pat
 """
 
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
-import uvicorn
+import asyncio
 import logging
+import logging.handlers
 import os
+import queue
+import time
+import zlib
+import orjson
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 # Import application modules
-from database import DatabaseManager
+from database import db_manager
+from middleware import LightCORS
+from static_files import CachedStaticFiles, build_bundle
 from routers import auth, maps, entities
 
-# Configure logging
+# Configure logging: request threads only enqueue records; a background
+# listener thread does the formatting and the file/console writes
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('beisman_app.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Leave the message bare; the listener's handlers apply the real format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('beisman_app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_queue_handler]
 )
+log_listener.start()
 logger = logging.getLogger(__name__)
 
-# Database instance
-db_manager = None
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
-    global db_manager
-    
     # Startup
     logger.info("Starting Beisman Maps Application...")
     
-    # Initialize database
-    db_manager = DatabaseManager()
+    # Check the shared database manager (the same instance the routers use)
     try:
-        if db_manager.test_connection():
+        if await db_manager.test_connection_async():
             logger.info("✅ Database connection successful")
+            await asyncio.to_thread(db_manager.prewarm_pool)
         else:
             logger.warning("❌ Database connection failed - Check configuration")
     except Exception as e:
         logger.error(f"❌ Database initialization error: {e}")
     
-    # Create static directories if they don't exist
-    static_dirs = ["static", "static/css", "static/js", "static/images"]
-    for dir_path in static_dirs:
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+    # Build the OpenAPI schema now; FastAPI keeps it, so /docs never pays for it
+    if DOCS_ENABLED:
+        app.openapi()
     
     logger.info("🚀 Application startup complete")
     
@@ -64,69 +70,71 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Beisman Maps Application...")
-    if db_manager:
-        db_manager.close_connection()
+    db_manager.close_connection()
     logger.info("👋 Application shutdown complete")
+    # Flushes any queued records before the process exits
+    log_listener.stop()
+
+# API docs are on by default and off in production (override with ENABLE_DOCS=0/1)
+DOCS_ENABLED = os.getenv("ENABLE_DOCS", "0" if os.getenv("ENVIRONMENT") == "production" else "1") == "1"
 
 # Create FastAPI application
 app = FastAPI(
     title="Beisman Maps Application",
     description="A Windows 95-style web application for managing Beisman Maps - New Mexico Highlands University",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    lifespan=lifespan
+    docs_url="/docs" if DOCS_ENABLED else None,
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
+    lifespan=lifespan,
+    # orjson for every endpoint
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-)
+# CORS middleware configuration (any origin, with credentials)
+app.add_middleware(LightCORS)
 
 # Mount static files
 static_path = Path(__file__).parent / "static"
-app.mount("/static", StaticFiles(directory=static_path), name="static")
+
+# Hashed CSS/JS bundles, built before the mount so they get ETags and .gz copies
+_CSS_SOURCES = ["css/windows95.css", "css/styles.css"]
+_JS_SOURCES = ["js/app.js"]
+_css_bundle = build_bundle(static_path, _CSS_SOURCES, "css", ".css")
+_js_bundle = build_bundle(static_path, _JS_SOURCES, "js", ".js")
+
+app.mount("/static", CachedStaticFiles(directory=static_path), name="static")
 
 # Include API routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(maps.router, prefix="/api/maps", tags=["Maps"])
 app.include_router(entities.router, prefix="/api/entities", tags=["Entities"])
 
-# Exception handlers
+# Exception handlers - fixed envelopes are serialized once; only the errors list varies
+_VALIDATION_ERROR_PREFIX = orjson.dumps({"success": False, "message": "Validation error"})[:-1] + b',"errors":'
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "success": False,
+    "message": "Internal server error",
+    "error": "Please contact the system administrator"
+})
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors"""
-    logger.warning(f"Validation error on {request.url}: {exc.errors()}")
-    return JSONResponse(
-        status_code=422,
-        content={
-            "success": False,
-            "message": "Validation error",
-            "errors": exc.errors()
-        }
-    )
+    errors = exc.errors()
+    logger.warning(f"Validation error on {request.url}: {errors}")
+    # default=str covers exception objects pydantic puts in an error's ctx
+    body = _VALIDATION_ERROR_PREFIX + orjson.dumps(errors, default=str) + b"}"
+    return Response(body, status_code=422, media_type="application/json")
 
 @app.exception_handler(500)
 async def internal_server_error_handler(request: Request, exc: Exception):
     """Handle internal server errors"""
     logger.error(f"Internal server error on {request.url}: {str(exc)}")
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "message": "Internal server error",
-            "error": "Please contact the system administrator"
-        }
-    )
+    return Response(_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
-# Main HTML content - shared for all frontend routes
-def get_main_html_content():
-    """Get the main HTML page content"""
-    return """
+# Main HTML content - shared for all frontend routes, built once at import
+_INDEX_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -135,8 +143,7 @@ def get_main_html_content():
         <title>Beisman Maps - New Mexico Highlands University</title>
         <meta name="description" content="Beisman Maps management system for New Mexico Highlands University">
         <meta name="author" content="New Mexico Highlands University">
-        <link rel="stylesheet" href="/static/css/windows95.css">
-        <link rel="stylesheet" href="/static/css/styles.css">
+        {{css_links}}
         <link rel="icon" type="image/x-icon" href="/static/images/favicon.ico">
     </head>
     <body>
@@ -214,62 +221,82 @@ def get_main_html_content():
         </div>
 
         <!-- JavaScript Application -->
-        <script src="/static/js/app.js"></script>
+        {{js_scripts}}
     </body>
     </html>
     """
 
+# Point the page at the hashed bundles (or the individual sources if bundling failed)
+_css_hrefs = [_css_bundle] if _css_bundle else [f"/static/{source}" for source in _CSS_SOURCES]
+_js_srcs = [_js_bundle] if _js_bundle else [f"/static/{source}" for source in _JS_SOURCES]
+MAIN_HTML_CONTENT = _INDEX_TEMPLATE.replace(
+    "{{css_links}}", "\n        ".join(f'<link rel="stylesheet" href="{href}">' for href in _css_hrefs)
+).replace(
+    "{{js_scripts}}", "\n        ".join(f'<script src="{src}"></script>' for src in _js_srcs)
+)
+
+# Encoded once; every page request sends these bytes or a 304
+_INDEX_BYTES = MAIN_HTML_CONTENT.encode("utf-8")
+_INDEX_ETAG = f'W/"{zlib.crc32(_INDEX_BYTES):x}"'
+# no-cache: the page names the current bundle files, which a restart replaces,
+# so it must always be revalidated (a cheap 304 through the ETag)
+_INDEX_HEADERS = {
+    "content-length": str(len(_INDEX_BYTES)),
+    "cache-control": "no-cache",
+    "etag": _INDEX_ETAG,
+}
+
+def get_main_html_content():
+    """Get the main HTML page content"""
+    return MAIN_HTML_CONTENT
+
+def index_response(request: Request) -> Response:
+    """Main HTML page, or 304 when the browser already has this version"""
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304, headers={"etag": _INDEX_ETAG, "cache-control": "no-cache"})
+    return Response(content=_INDEX_BYTES, media_type="text/html", headers=_INDEX_HEADERS)
+
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def serve_main_page():
+async def serve_main_page(request: Request):
     """Serve the main HTML page"""
-    return HTMLResponse(content=get_main_html_content())
+    return index_response(request)
 
-# SPA Route Handler - catch-all for frontend routes
-@app.get("/{path:path}", response_class=HTMLResponse, include_in_schema=False)
-async def serve_spa_routes(path: str):
-    """
-    Catch-all route to serve the main HTML for all frontend routes.
-    This enables deep linking and browser history for the SPA.
-    Excludes API routes which are handled by their respective routers.
-    """
-    # Skip API routes and static files - let them be handled normally
-    if path.startswith("api/") or path.startswith("static/") or path.startswith("docs") or path.startswith("redoc"):
-        # This should not happen due to route priority, but safety check
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail="Not found")
-    
-    # For all frontend routes, serve the main HTML
-    # The JavaScript router will handle the actual page rendering
-    return HTMLResponse(content=get_main_html_content())
+# Health responses are reused for a few seconds so probes don't hammer the database
+_HEALTH_TTL = 5.0
+_health_cache = (0.0, b"", 0)
 
 @app.get("/api/health", tags=["System"])
 async def health_check():
     """System health check endpoint"""
+    global _health_cache
+    cached_at, body, status_code = _health_cache
+    if time.monotonic() - cached_at < _HEALTH_TTL:
+        return Response(body, status_code=status_code, media_type="application/json")
+    
     try:
-        db_status = db_manager.test_connection() if db_manager else False
+        db_status = await db_manager.test_connection_async()
         
         health_data = {
             "status": "healthy" if db_status else "degraded",
             "database": "connected" if db_status else "disconnected",
-            "timestamp": db_manager.get_current_timestamp() if db_manager else None,
+            "timestamp": await db_manager.get_current_timestamp_async(),
             "version": "1.0.0",
             "environment": os.getenv("ENVIRONMENT", "development")
         }
         
         status_code = 200 if db_status else 503
+        body = orjson.dumps({
+            "success": db_status,
+            "message": "System is healthy" if db_status else "System degraded - database issues",
+            "data": health_data
+        })
+        _health_cache = (time.monotonic(), body, status_code)
         
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "success": db_status,
-                "message": "System is healthy" if db_status else "System degraded - database issues",
-                "data": health_data
-            }
-        )
+        return Response(body, status_code=status_code, media_type="application/json")
         
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -282,37 +309,61 @@ async def health_check():
             }
         )
 
+# Constant payload, serialized once
+_APP_INFO = orjson.dumps({
+    "name": "Beisman Maps Application",
+    "version": "1.0.0",
+    "description": "FastAPI-based map management system with Windows 95 aesthetic",
+    "university": "New Mexico Highlands University",
+    "tech_stack": {
+        "backend": "FastAPI",
+        "frontend": "HTML/CSS/JavaScript",
+        "database": "SQL Server",
+        "authentication": "Session-based"
+    },
+    "features": [
+        "Browse Maps",
+        "Browse Entities", 
+        "Admin Authentication",
+        "CRUD Operations",
+        "Data Export",
+        "Windows 95 Theme",
+        "Browser History Support"
+    ],
+    "admin_credentials": {
+        "note": "Default credentials should be changed in production",
+        "username": "admin",
+        "password": "admin"
+    }
+})
+
 @app.get("/api/info", tags=["System"])
 async def app_info():
     """Application information endpoint"""
-    return {
-        "name": "Beisman Maps Application",
-        "version": "1.0.0",
-        "description": "FastAPI-based map management system with Windows 95 aesthetic",
-        "university": "New Mexico Highlands University",
-        "tech_stack": {
-            "backend": "FastAPI",
-            "frontend": "HTML/CSS/JavaScript",
-            "database": "SQL Server",
-            "authentication": "Session-based"
-        },
-        "features": [
-            "Browse Maps",
-            "Browse Entities", 
-            "Admin Authentication",
-            "CRUD Operations",
-            "Data Export",
-            "Windows 95 Theme",
-            "Browser History Support"
-        ],
-        "admin_credentials": {
-            "note": "Default credentials should be changed in production",
-            "username": "admin",
-            "password": "admin"
-        }
-    }
+    return Response(_APP_INFO, media_type="application/json")
+
+# SPA Route Handler - catch-all for frontend routes
+@app.get("/{path:path}", response_class=HTMLResponse, include_in_schema=False)
+async def serve_spa_routes(path: str, request: Request):
+    """
+    Catch-all route to serve the main HTML for all frontend routes.
+    This enables deep linking and browser history for the SPA.
+    Excludes API routes which are handled by their respective routers.
+    """
+    # Skip API routes and static files - let them be handled normally
+    if path.startswith("api/") or path.startswith("static/") or path.startswith("docs") or path.startswith("redoc"):
+        # This should not happen due to route priority, but safety check
+        from fastapi import HTTPException
+        raise HTTPException(status_code=404, detail="Not found")
+    
+    # For all frontend routes, serve the main HTML
+    # The JavaScript router will handle the actual page rendering
+    return index_response(request)
 
 if __name__ == "__main__":
+    # Only needed for the development server; ASGI servers import main:app directly
+    import uvicorn
+
     # Development server configuration
     print("=" * 60)
     print("  🏫 Beisman Maps Application")
@@ -326,6 +377,8 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
     
+    # Production servers should drop the same headers, e.g.
+    #   uvicorn main:app --no-server-header --no-date-header
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
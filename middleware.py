@@ -1,14 +1,22 @@
-from fastapi import HTTPException, Request, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import HTTPException, Request
+from fastapi.security import HTTPBearer
 from typing import Optional, Dict, Any
-from datetime import datetime
 import logging
+import time
 
 from session_manager import get_session, hash_session_id
 
+__all__ = [
+    "require_auth", "require_admin", "optional_auth", "get_current_user", "get_current_session",
+    "verify_session", "AuthenticationMiddleware", "LightCORS", "AuthenticationError", "AuthorizationError",
+]
+
 logger = logging.getLogger(__name__)
 security = HTTPBearer(auto_error=False)
 
+# Sentinel for "user not looked up yet" on request.state (None means anonymous)
+_UNRESOLVED = object()
+
 async def get_current_session(request: Request) -> Optional[Dict[str, Any]]:
     """Get current session data from request"""
     try:
@@ -24,19 +32,48 @@ async def get_current_session(request: Request) -> Optional[Dict[str, Any]]:
         return None
 
 async def get_current_user(request: Request) -> Optional[Dict[str, Any]]:
-    """Get current authenticated user"""
+    """Get current authenticated user, resolved at most once per request"""
+    # request.state is shared by every Request built on this scope, so
+    # AuthenticationMiddleware and chained dependencies reuse the first lookup
+    user = getattr(request.state, "user", _UNRESOLVED)
+    if user is not _UNRESOLVED:
+        return user
+    
     session_data = await get_current_session(request)
+    user = _user_from_session(session_data, request.cookies.get("session_id", ""))
     
+    request.state.user = user
+    return user
+
+def _user_from_session(session_data: Optional[Dict[str, Any]], session_id: str) -> Optional[Dict[str, Any]]:
+    """Build the per-request user dict from stored session data"""
     if not session_data:
         return None
-        
     return {
         "username": session_data.get("username"),
         "display_name": session_data.get("display_name"),
         "is_admin": session_data.get("is_admin", False),
-        "session_id": hash_session_id(request.cookies.get("session_id", ""))
+        "session_id": hash_session_id(session_id)
     }
 
+def _session_cookie(headers) -> Optional[str]:
+    """Pull session_id out of raw ASGI headers without building a cookie jar"""
+    for name, value in headers:
+        if name != b"cookie":
+            continue
+        start = 0
+        while True:
+            i = value.find(b"session_id=", start)
+            if i < 0:
+                return None
+            # Must start a cookie pair, not end another name ("xsession_id=")
+            if i == 0 or value[i - 1] in b" ;":
+                end = value.find(b";", i)
+                session_id = value[i + 11:end if end >= 0 else None].strip()
+                return session_id.decode("latin-1") or None
+            start = i + 11
+    return None
+
 async def require_auth(request: Request) -> Dict[str, Any]:
     """Require authentication - raises HTTPException if not authenticated"""
     user = await get_current_user(request)
@@ -51,15 +88,24 @@ async def require_auth(request: Request) -> Dict[str, Any]:
 
 async def require_admin(request: Request) -> Dict[str, Any]:
     """Require admin authentication - raises HTTPException if not admin"""
-    user = await require_auth(request)
+    # Straight to the session store, but the user dict is built the same way
+    # get_current_user builds it, so callers never hold the stored session
+    session_id = request.cookies.get("session_id")
+    session_data = get_session(session_id) if session_id else None
+    
+    if not session_data:
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication required"
+        )
     
-    if not user.get("is_admin", False):
+    if not session_data.get("is_admin", False):
         raise HTTPException(
             status_code=403,
             detail="Admin access required"
         )
     
-    return user
+    return _user_from_session(session_data, session_id)
 
 async def optional_auth(request: Request) -> Optional[Dict[str, Any]]:
     """Optional authentication - returns user if authenticated, None if not"""
@@ -70,44 +116,90 @@ def verify_session(session_data: Dict[str, Any]) -> bool:
     if not session_data:
         return False
         
-    # Check expiration
-    expires_at = session_data.get("expires_at")
-    if expires_at and datetime.now() > expires_at:
-        return False
-        
-    return True
-
-# Dependency functions for FastAPI
-def get_optional_user(request: Request):
-    """FastAPI dependency for optional user"""
-    return Depends(lambda: optional_auth(request))
-
-def get_authenticated_user(request: Request):
-    """FastAPI dependency for required authentication"""
-    return Depends(lambda: require_auth(request))
-
-def get_admin_user(request: Request):
-    """FastAPI dependency for required admin authentication"""
-    return Depends(lambda: require_admin(request))
+    # Check expiration against the monotonic deadline set by create_session
+    expires_at_mono = session_data.get("expires_at_mono")
+    return not (expires_at_mono and time.monotonic() > expires_at_mono)
 
 class AuthenticationMiddleware:
     """Custom authentication middleware class"""
     
+    # Paths that never need the user: assets, API docs and system endpoints
+    SKIP_PREFIXES = ("/static/", "/docs", "/redoc", "/openapi.json", "/api/health", "/api/info")
+    
     def __init__(self, app):
         self.app = app
     
     async def __call__(self, scope, receive, send):
-        if scope["type"] == "http":
-            request = Request(scope, receive)
+        if scope["type"] == "http" and not scope["path"].startswith(self.SKIP_PREFIXES):
+            session_id = _session_cookie(scope["headers"])
+            session_data = None
+            if session_id:
+                try:
+                    session_data = get_session(session_id)
+                except Exception as e:
+                    logger.error(f"Error getting session: {e}")
             
-            # Add user information to request state
-            user = await get_current_user(request)
-            request.state.user = user
-            request.state.is_authenticated = user is not None
-            request.state.is_admin = user.get("is_admin", False) if user else False
+            # Add user information to request state (the dict behind request.state)
+            user = _user_from_session(session_data, session_id or "")
+            state = scope.setdefault("state", {})
+            state["user"] = user
+            state["is_authenticated"] = user is not None
+            state["is_admin"] = user.get("is_admin", False) if user else False
         
         await self.app(scope, receive, send)
 
+class LightCORS:
+    """Pure ASGI CORS middleware: answers preflights and adds allow headers to responses"""
+    
+    def __init__(self, app, allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"), max_age: int = 600):
+        self.app = app
+        self.allow_methods = ", ".join(allow_methods).encode("latin-1")
+        self.max_age = str(max_age).encode("latin-1")
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        # Same-origin requests carry no Origin header and pass straight through
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+        
+        # Any origin is allowed; with credentials it must be echoed back rather than "*"
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", self.allow_methods),
+                (b"access-control-max-age", self.max_age),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
 # Error handlers
 class AuthenticationError(Exception):
     """Custom authentication error"""
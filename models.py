@@ -2,9 +2,10 @@
 Pydantic Models - Fixed to match exact Streamlit database column structure
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from enum import Enum
 
 # Authentication Models
 class LoginRequest(BaseModel):
@@ -54,8 +55,8 @@ class MapResponse(MapBase):
     CreatedDate: Optional[str] = None  # If this column exists
     ModifiedDate: Optional[str] = None  # If this column exists
     
-    class Config:
-        from_attributes = True
+    # Immutable and tolerant of extra columns the table may return
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", populate_by_name=True)
 
 class MapListResponse(BaseModel):
     """Response model for paginated map list"""
@@ -79,8 +80,8 @@ class EntityResponse(EntityBase):
     EntityID: Optional[int] = None  # If this column exists
     CreatedDate: Optional[str] = None  # If this column exists
     
-    class Config:
-        from_attributes = True
+    # See MapResponse
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore", populate_by_name=True)
 
 class EntityListResponse(BaseModel):
     """Response model for paginated entity list"""
@@ -92,16 +93,20 @@ class EntityListResponse(BaseModel):
     has_next: bool = False
     has_previous: bool = False
 
-# Search and Pagination Models
+# Search and Pagination Models (frozen, so one instance can be shared across requests)
 class SearchRequest(BaseModel):
     search_term: Optional[str] = Field(None, max_length=255)
     page: int = Field(1, ge=1)
     page_size: int = Field(50, ge=1, le=1000)
+    
+    model_config = ConfigDict(frozen=True)
 
 class PaginationParams(BaseModel):
     page: int = Field(1, ge=1)
     page_size: int = Field(50, ge=1, le=1000)
     search: Optional[str] = Field(None, max_length=255)
+    
+    model_config = ConfigDict(frozen=True)
 
 # API Response Models
 class APIResponse(BaseModel):
@@ -130,7 +135,9 @@ class HealthCheckResponse(BaseModel):
 class DeleteRequest(BaseModel):
     """Model for delete operations"""
     id: int = Field(..., ge=1)
-    confirm: bool = Field(True)
+    confirm: bool = Field(...)  # Must be sent explicitly
+    
+    model_config = ConfigDict(frozen=True)
 
 class DeleteResponse(BaseModel):
     """Response model for delete operations"""
@@ -165,14 +172,24 @@ class MapFormData(BaseModel):
         populate_by_name = True
 
 # Status and Error Models
+class StatusType(str, Enum):
+    """Kinds of status message"""
+    ERROR = "error"
+    WARNING = "warning"
+    INFO = "info"
+    SUCCESS = "success"
+
 class StatusMessage(BaseModel):
     """Model for status messages displayed in the golden box"""
-    type: str = Field(..., pattern="^(error|warning|info|success)$")  # Fixed: pattern instead of regex
+    type: StatusType  # Enum membership check instead of a regex pattern
     title: str
     message: str
     details: Optional[Dict[str, Any]] = None
     show_suggestions: bool = True
     
+    # Keep type a plain string once validated
+    model_config = ConfigDict(use_enum_values=True)
+    
 class DatabaseError(BaseModel):
     """Model for database error information"""
     error_code: str
@@ -235,36 +252,27 @@ class StreamlitEntityData(BaseModel):
         }
 
 # Conversion helper functions
+
+# FastAPI field -> database column. FastAPI aliases come first so that real
+# database fields, listed after them, win when a payload carries both
+_FIELD_MAP = {
+    'MapName': 'Number',
+    'Description': 'PropertyDetails',
+    'Location': 'Drawer',
+    'Number': 'Number',
+    'Drawer': 'Drawer',
+    'PropertyDetails': 'PropertyDetails',
+    'CreatedBy': 'CreatedBy',
+}
+
+# Fields every response row must carry
+_RESPONSE_DEFAULTS = {'Number': '', 'Drawer': '', 'PropertyDetails': ''}
+
 def convert_fastapi_to_db_format(data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert FastAPI format to database format"""
-    db_data = {}
-    
-    # Map conversions
-    if 'MapName' in data:
-        db_data['Number'] = data['MapName']
-    if 'Description' in data:
-        db_data['PropertyDetails'] = data['Description']
-    if 'Location' in data:
-        db_data['Drawer'] = data['Location']
-    
-    # Keep database format fields as-is
-    for key in ['Number', 'Drawer', 'PropertyDetails', 'CreatedBy']:
-        if key in data:
-            db_data[key] = data[key]
-    
-    return db_data
+    return {column: data[key] for key, column in _FIELD_MAP.items() if key in data}
 
 def convert_db_to_response_format(data: Dict[str, Any]) -> Dict[str, Any]:
     """Convert database format to response format"""
     # Database format is already correct, just ensure all expected fields exist
-    response_data = data.copy()
-    
-    # Ensure required fields exist
-    if 'Number' not in response_data:
-        response_data['Number'] = ''
-    if 'Drawer' not in response_data:
-        response_data['Drawer'] = ''
-    if 'PropertyDetails' not in response_data:
-        response_data['PropertyDetails'] = ''
-    
-    return response_data
+    return {**_RESPONSE_DEFAULTS, **data}
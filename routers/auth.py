@@ -1,28 +1,25 @@
-from fastapi import APIRouter, HTTPException, Depends, Request, Response
-from fastapi.responses import JSONResponse
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from datetime import datetime
 import logging
 
 from models import LoginRequest, LoginResponse, SessionInfo, APIResponse
-from database import DatabaseManager
+from database import db_manager
 from session_manager import (
     create_session, get_session, clear_session, hash_session_id,
-    cleanup_expired_sessions, get_active_sessions_count, active_sessions
+    cleanup_expired_sessions, get_active_sessions_count
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 @router.post("/login", response_model=LoginResponse)
 async def login(request: LoginRequest, response: Response):
     """Admin login endpoint"""
     try:
-        db_manager = DatabaseManager()
-        
         # Validate credentials
-        if db_manager.validate_admin_credentials(request.username, request.password):
-            user_info = db_manager.get_user_info(request.username)
+        if await db_manager.validate_admin_credentials_async(request.username, request.password):
+            user_info = await db_manager.get_user_info_async(request.username)
             
             # Create session using session manager
             session_id, session_data = create_session(
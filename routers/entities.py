@@ -1,19 +1,21 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Optional, Dict, Any
+import asyncio
 import logging
 
 from models import (
     EntityResponse, EntityListResponse, APIResponse, DeleteResponse, 
     SearchRequest
 )
-from database import DatabaseManager
-from middleware import require_admin, optional_auth, require_auth
+from database import db_manager
+from middleware import require_admin, optional_auth
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 @router.get("", response_model=EntityListResponse)
+@router.get("/", response_model=EntityListResponse, include_in_schema=False)
 async def get_entities(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
@@ -23,47 +25,28 @@ async def get_entities(
 ):
     """Get paginated list of entities with optional search"""
     try:
-        db_manager = DatabaseManager()
-        
         # Calculate offset
         offset = (page - 1) * page_size
         
         # Get entities data using the corrected method
-        result = db_manager.get_entities_data(
+        result = await db_manager.get_entities_data_async(
             limit=page_size,
             offset=offset,
             search_term=search
         )
         
-        # Convert to response format - data already has correct column names
-        entities_data = []
-        for entity_item in result["data"]:
-            try:
-                entities_data.append(EntityResponse(**entity_item))
-            except Exception as e:
-                logger.error(f"Error creating EntityResponse for item {entity_item}: {e}")
-                # Try with default values if required fields are missing
-                entity_item_safe = {
-                    'EntityName': entity_item.get('EntityName', ''),
-                    'BeismanNumber': entity_item.get('BeismanNumber', ''),
-                    'EntityID': entity_item.get('EntityID'),
-                    'CreatedDate': entity_item.get('CreatedDate')
-                }
-                try:
-                    entities_data.append(EntityResponse(**entity_item_safe))
-                except Exception as e2:
-                    logger.error(f"Error creating EntityResponse even with safe data {entity_item_safe}: {e2}")
-                    continue
-        
-        response = EntityListResponse(
-            data=entities_data,
-            total_count=result["total_count"],
-            current_page=result["current_page"],
-            total_pages=result["total_pages"],
-            search_term=search,
-            has_next=result.get("has_next", False),
-            has_previous=result.get("has_previous", False)
-        )
+        # Rows go out as-is; returning the response directly skips response_model validation
+        entities_data = result["data"]
+        
+        response = ORJSONResponse({
+            "data": entities_data,
+            "total_count": result["total_count"],
+            "current_page": result["current_page"],
+            "total_pages": result["total_pages"],
+            "search_term": search,
+            "has_next": result.get("has_next", False),
+            "has_previous": result.get("has_previous", False)
+        })
         
         logger.info(f"Retrieved {len(entities_data)} entities for page {page}")
         return response
@@ -82,11 +65,9 @@ async def get_entity(
 ):
     """Get a specific entity by ID"""
     try:
-        db_manager = DatabaseManager()
-        
         # Get all entities and filter by EntityID (if it exists)
         # This is a workaround since we don't have a specific get_entity_by_id method
-        result = db_manager.get_entities_data(limit=1000, offset=0)
+        result = await db_manager.get_entities_data_async(limit=1000, offset=0)
         
         entity_data = None
         for entity in result["data"]:
@@ -120,10 +101,8 @@ async def delete_entity(
 ):
     """Delete an entity (Admin only)"""
     try:
-        db_manager = DatabaseManager()
-        
         # Check if entity exists first
-        result = db_manager.get_entities_data(limit=1000, offset=0)
+        result = await db_manager.get_entities_data_async(limit=1000, offset=0)
         entity_exists = any(entity.get("EntityID") == entity_id for entity in result["data"])
         
         if not entity_exists:
@@ -133,7 +112,7 @@ async def delete_entity(
             )
         
         # Delete the entity using corrected method
-        success = db_manager.delete_entity(entity_id)
+        success = await db_manager.delete_entity_async(entity_id)
         
         if success:
             logger.info(f"Entity {entity_id} deleted by {user.get('username')}")
@@ -164,36 +143,28 @@ async def search_entities(
 ):
     """Advanced search for entities"""
     try:
-        db_manager = DatabaseManager()
-        
         # Calculate offset
         offset = (search_request.page - 1) * search_request.page_size
         
         # Get entities data with search using corrected method
-        result = db_manager.get_entities_data(
+        result = await db_manager.get_entities_data_async(
             limit=search_request.page_size,
             offset=offset,
             search_term=search_request.search_term
         )
         
-        # Convert to response format
-        entities_data = []
-        for entity_item in result["data"]:
-            try:
-                entities_data.append(EntityResponse(**entity_item))
-            except Exception as e:
-                logger.error(f"Error creating EntityResponse for item {entity_item}: {e}")
-                continue
-        
-        response = EntityListResponse(
-            data=entities_data,
-            total_count=result["total_count"],
-            current_page=result["current_page"],
-            total_pages=result["total_pages"],
-            search_term=search_request.search_term,
-            has_next=result.get("has_next", False),
-            has_previous=result.get("has_previous", False)
-        )
+        # Rows go out as-is; returning the response directly skips response_model validation
+        entities_data = result["data"]
+        
+        response = ORJSONResponse({
+            "data": entities_data,
+            "total_count": result["total_count"],
+            "current_page": result["current_page"],
+            "total_pages": result["total_pages"],
+            "search_term": search_request.search_term,
+            "has_next": result.get("has_next", False),
+            "has_previous": result.get("has_previous", False)
+        })
         
         logger.info(f"Search returned {len(entities_data)} entities for term: {search_request.search_term}")
         return response
@@ -212,15 +183,18 @@ async def export_entities_csv(
 ):
     """Export entities data as CSV (Admin only)"""
     try:
-        db_manager = DatabaseManager()
+        timestamp = await db_manager.get_current_timestamp_async().replace('/', '-').replace(' ', '_').replace(':', '-')
+        filename = f"beisman_entities_export_{timestamp}.csv"
         
-        # Get all entities data (no pagination for export)
+        # Get all entities data (no pagination for export); the unfiltered list is streamed
         if search:
-            all_entities = db_manager.search_entities(search)
+            rows = iter(await db_manager.search_entities_async(search))
         else:
-            all_entities = db_manager.get_all_entities(limit=10000)  # Large limit for export
+            rows = db_manager.iter_all_entities(limit=10000)  # Large limit for export
         
-        if not all_entities:
+        # The first batch is fetched here, so run it off the event loop
+        first_row = await asyncio.to_thread(next, rows, None)
+        if first_row is None:
             raise HTTPException(
                 status_code=404,
                 detail="No entities found for export"
@@ -230,27 +204,32 @@ async def export_entities_csv(
         import csv
         import io
         
-        output = io.StringIO()
-        
-        # Use actual column names from data
-        fieldnames = list(all_entities[0].keys()) if all_entities else ['EntityName', 'BeismanNumber']
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_entities)
-        
-        csv_content = output.getvalue()
-        output.close()
+        def generate_csv():
+            output = io.StringIO()
+            
+            # Use actual column names from data; every row dict has the same key
+            # order, so values are written positionally without DictWriter's per-row key checks
+            writer = csv.writer(output)
+            writer.writerow(first_row.keys())
+            writer.writerow(first_row.values())
+            # Bound methods hoisted out of the per-row loop
+            writerow, tell = writer.writerow, output.tell
+            for row in rows:
+                writerow(row.values())
+                # Flush in ~64 KB pieces so only one chunk is held in memory
+                if tell() >= 65536:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+            yield output.getvalue()
         
         # Return CSV response
-        from fastapi.responses import Response
+        from fastapi.responses import StreamingResponse
         
-        timestamp = db_manager.get_current_timestamp().replace('/', '-').replace(' ', '_').replace(':', '-')
-        filename = f"beisman_entities_export_{timestamp}.csv"
-        
-        logger.info(f"Entities CSV export generated by {user.get('username')}: {len(all_entities)} records")
+        logger.info(f"Entities CSV export started by {user.get('username')}")
         
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            generate_csv(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -270,21 +249,19 @@ async def get_entities_stats(
 ):
     """Get entities statistics summary"""
     try:
-        db_manager = DatabaseManager()
-        
         # Get total count
-        total_entities = db_manager.get_entities_count()
+        total_entities = await db_manager.get_entities_count_async()
         
         stats = {
             "total_entities": total_entities,
-            "timestamp": db_manager.get_current_timestamp()
+            "timestamp": await db_manager.get_current_timestamp_async()
         }
         
         # Add admin-specific stats if user is admin
         if user and user.get('is_admin'):
             stats.update({
-                "database_status": "connected" if db_manager.test_connection() else "disconnected",
-                "last_update": db_manager.get_current_timestamp()
+                "database_status": "connected" if await db_manager.connection_ok_async() else "disconnected",
+                "last_update": await db_manager.get_current_timestamp_async()
             })
         
         logger.info(f"Entities stats retrieved: {total_entities} total entities")
@@ -322,14 +299,12 @@ async def bulk_delete_entities(
                 detail="Cannot delete more than 100 entities at once"
             )
         
-        db_manager = DatabaseManager()
-        
         deleted_count = 0
         failed_deletes = []
         
         for entity_id in entity_ids:
             try:
-                success = db_manager.delete_entity(entity_id)
+                success = await db_manager.delete_entity_async(entity_id)
                 if success:
                     deleted_count += 1
                 else:
@@ -369,18 +344,13 @@ async def get_entity_types(
 ):
     """Get list of unique entity types"""
     try:
-        db_manager = DatabaseManager()
-        
-        # Get all entities to extract unique types
-        all_entities = db_manager.get_all_entities(limit=10000)
-        
-        entity_types = set()
-        for entity in all_entities:
-            entity_type = entity.get("EntityType")
-            if entity_type:
-                entity_types.add(entity_type)
+        types_list = await db_manager.get_entity_types_async()
         
-        types_list = sorted(list(entity_types))
+        if types_list is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Entity types are not available: the entities table has no EntityType column"
+            )
         
         logger.info(f"Retrieved {len(types_list)} unique entity types")
         
@@ -393,6 +363,8 @@ async def get_entity_types(
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting entity types: {e}")
         raise HTTPException(
@@ -409,46 +381,38 @@ async def filter_entities_by_type(
 ):
     """Filter entities by type"""
     try:
-        db_manager = DatabaseManager()
-        
-        # Get all entities and filter in Python (since EntityType might not exist in your schema)
-        all_entities = db_manager.get_all_entities(limit=10000)
-        
-        # Filter by entity type (if the column exists)
-        filtered_entities = [
-            entity for entity in all_entities 
-            if entity.get("EntityType", "").lower() == entity_type.lower()
-        ]
-        
-        # Apply pagination
-        total_count = len(filtered_entities)
+        # Filtered and paged in SQL; EntityType is selected explicitly since it
+        # is not part of the default entity columns
         offset = (page - 1) * page_size
-        paginated_entities = filtered_entities[offset:offset + page_size]
+        result = await db_manager.get_entities_by_type_async(entity_type, limit=page_size, offset=offset)
         
-        # Convert to response format
-        entities_data = []
-        for entity_item in paginated_entities:
-            try:
-                entities_data.append(EntityResponse(**entity_item))
-            except Exception as e:
-                logger.error(f"Error creating EntityResponse for item {entity_item}: {e}")
-                continue
+        if result is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Entity types are not available: the entities table has no EntityType column"
+            )
+        
+        # Rows go out as-is; returning the response directly skips response_model validation
+        entities_data = result["data"]
+        total_count = result["total_count"]
         
         total_pages = (total_count + page_size - 1) // page_size
         
-        response = EntityListResponse(
-            data=entities_data,
-            total_count=total_count,
-            current_page=page,
-            total_pages=total_pages,
-            search_term=f"Type: {entity_type}",
-            has_next=page < total_pages,
-            has_previous=page > 1
-        )
+        response = ORJSONResponse({
+            "data": entities_data,
+            "total_count": total_count,
+            "current_page": page,
+            "total_pages": total_pages,
+            "search_term": f"Type: {entity_type}",
+            "has_next": page < total_pages,
+            "has_previous": page > 1
+        })
         
         logger.info(f"Filtered {len(entities_data)} entities by type: {entity_type}")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error filtering entities by type: {e}")
         raise HTTPException(
@@ -463,18 +427,18 @@ async def get_entities_for_map(
 ):
     """Get all entities associated with a specific map"""
     try:
-        db_manager = DatabaseManager()
-        
         # Use the corrected method from your Streamlit code
-        entities_data = db_manager.get_entities_for_map(map_number)
+        entity_names = await db_manager.get_entities_for_map_async(map_number)
         
-        if not entities_data:
+        if not entity_names:
             return APIResponse(
                 success=True,
                 message="No entities found for this map",
                 data={"entities": [], "map_number": map_number}
             )
         
+        # Keep the response shape the frontend reads (entity.EntityName)
+        entities_data = [{"EntityName": name} for name in entity_names]
         logger.info(f"Retrieved {len(entities_data)} entities for map {map_number}")
         
         return APIResponse(
@@ -503,10 +467,8 @@ async def add_entity_to_map(
 ):
     """Add an entity to a map (Admin only)"""
     try:
-        db_manager = DatabaseManager()
-        
         # Use the corrected method from your Streamlit code
-        success, message = db_manager.add_entity_to_map(map_number, entity_name)
+        success, message = await db_manager.add_entity_to_map_async(map_number, entity_name)
         
         if success:
             logger.info(f"Entity '{entity_name}' added to map {map_number} by {user.get('username')}")
@@ -542,10 +504,8 @@ async def remove_entity_from_map(
 ):
     """Remove an entity from a map (Admin only)"""
     try:
-        db_manager = DatabaseManager()
-        
         # Use the corrected method from your Streamlit code
-        success, message = db_manager.remove_entity_from_map(map_number, entity_name)
+        success, message = await db_manager.remove_entity_from_map_async(map_number, entity_name)
         
         if success:
             logger.info(f"Entity '{entity_name}' removed from map {map_number} by {user.get('username')}")
@@ -570,4 +530,89 @@ async def remove_entity_from_map(
         raise HTTPException(
             status_code=500,
             detail=f"Failed to remove entity from map: {str(e)}"
+        )
+
+@router.post("/map/{map_number}/bulk-add", response_model=APIResponse)
+async def bulk_add_entities_to_map(
+    map_number: str,
+    entity_names: list[str],
+    request: Request,
+    user: Dict[str, Any] = Depends(require_admin)
+):
+    """Add multiple entities to a map in one transaction (Admin only)"""
+    try:
+        if not entity_names:
+            raise HTTPException(
+                status_code=400,
+                detail="No entity names provided"
+            )
+        
+        added_count, skipped_names, message = await db_manager.add_entities_to_map_async(map_number, entity_names)
+        
+        if not added_count:
+            raise HTTPException(
+                status_code=400,
+                detail=message
+            )
+        
+        logger.info(f"Bulk add to map {map_number} by {user.get('username')}: {added_count} added")
+        return APIResponse(
+            success=True,
+            message=message,
+            data={
+                "map_number": map_number,
+                "added_count": added_count,
+                "skipped_names": skipped_names
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in bulk add to map: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to add entities to map: {str(e)}"
+        )
+
+@router.post("/map/{map_number}/bulk-remove", response_model=APIResponse)
+async def bulk_remove_entities_from_map(
+    map_number: str,
+    entity_names: list[str],
+    request: Request,
+    user: Dict[str, Any] = Depends(require_admin)
+):
+    """Remove multiple entities from a map in one transaction (Admin only)"""
+    try:
+        if not entity_names:
+            raise HTTPException(
+                status_code=400,
+                detail="No entity names provided"
+            )
+        
+        removed_count, message = await db_manager.remove_entities_from_map_async(map_number, entity_names)
+        
+        if not removed_count:
+            raise HTTPException(
+                status_code=400,
+                detail=message
+            )
+        
+        logger.info(f"Bulk remove from map {map_number} by {user.get('username')}: {removed_count} removed")
+        return APIResponse(
+            success=True,
+            message=message,
+            data={
+                "map_number": map_number,
+                "removed_count": removed_count
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in bulk remove from map: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to remove entities from map: {str(e)}"
         )
\ No newline at end of file
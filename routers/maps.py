@@ -1,58 +1,59 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import Optional, Dict, Any
+import asyncio
 import logging
 
 from models import (
     MapCreate, MapUpdate, MapResponse, MapListResponse, 
     APIResponse, DeleteResponse, SearchRequest, convert_fastapi_to_db_format
 )
-from database import DatabaseManager
-from middleware import require_admin, optional_auth, require_auth
+from database import db_manager
+from middleware import require_admin, optional_auth
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
 @router.get("", response_model=MapListResponse)
+@router.get("/", response_model=MapListResponse, include_in_schema=False)
 async def get_maps(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=1000, description="Items per page"),
     search: Optional[str] = Query(None, description="Search term"),
+    include_entities: bool = Query(False, description="Attach each map's entity names"),
     request: Request = None,
     user: Optional[Dict[str, Any]] = Depends(optional_auth)
 ):
     """Get paginated list of maps with optional search"""
     try:
-        db_manager = DatabaseManager()
-        
         # Calculate offset
         offset = (page - 1) * page_size
         
         # Get maps data using the corrected method
-        result = db_manager.get_maps_data(
+        result = await db_manager.get_maps_data_async(
             limit=page_size,
             offset=offset,
             search_term=search
         )
         
-        # Convert to response format - data already has correct column names
-        maps_data = []
-        for map_item in result["data"]:
-            try:
-                maps_data.append(MapResponse(**map_item))
-            except Exception as e:
-                logger.error(f"Error creating MapResponse for item {map_item}: {e}")
-                continue
-        
-        response = MapListResponse(
-            data=maps_data,
-            total_count=result["total_count"],
-            current_page=result["current_page"],
-            total_pages=result["total_pages"],
-            search_term=search,
-            has_next=result.get("has_next", False),
-            has_previous=result.get("has_previous", False)
-        )
+        # Rows go out as-is; returning the response directly skips response_model validation
+        maps_data = result["data"]
+        
+        if include_entities and maps_data:
+            # One IN (...) query for the whole page instead of one lookup per map;
+            # new dicts, since the page rows may be shared with the result cache
+            entities_by_map = await db_manager.get_entities_for_maps_async([row["Number"] for row in maps_data])
+            maps_data = [{**row, "entities": entities_by_map.get(row["Number"], [])} for row in maps_data]
+        
+        response = ORJSONResponse({
+            "data": maps_data,
+            "total_count": result["total_count"],
+            "current_page": result["current_page"],
+            "total_pages": result["total_pages"],
+            "search_term": search,
+            "has_next": result.get("has_next", False),
+            "has_previous": result.get("has_previous", False)
+        })
         
         logger.info(f"Retrieved {len(maps_data)} maps for page {page}")
         return response
@@ -71,10 +72,8 @@ async def get_map(
 ):
     """Get a specific map by Number (not MapID)"""
     try:
-        db_manager = DatabaseManager()
-        
         # Use the corrected method that uses Number as primary key
-        map_data = db_manager.get_map_by_track_number(map_number)
+        map_data = await db_manager.get_map_by_track_number_async(map_number)
         
         if not map_data:
             raise HTTPException(
@@ -94,7 +93,35 @@ async def get_map(
             detail=f"Failed to retrieve map: {str(e)}"
         )
 
+@router.get("/{map_number}/with-entities")
+async def get_map_with_entities(
+    map_number: str,
+    user: Optional[Dict[str, Any]] = Depends(optional_auth)
+):
+    """Get a map and the names of its entities in one database round-trip"""
+    try:
+        map_data, entity_names = await db_manager.get_map_with_entities_async(map_number)
+        
+        if not map_data:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Map with Number {map_number} not found"
+            )
+        
+        logger.info(f"Retrieved map {map_number} with {len(entity_names)} entities")
+        return ORJSONResponse({"map": map_data, "entities": entity_names})
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving map {map_number} with entities: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve map: {str(e)}"
+        )
+
 @router.post("", response_model=APIResponse)
+@router.post("/", response_model=APIResponse, include_in_schema=False)
 async def create_map(
     map_data: MapCreate,
     request: Request,
@@ -102,8 +129,6 @@ async def create_map(
 ):
     """Create a new map (Admin only)"""
     try:
-        db_manager = DatabaseManager()
-        
         # Convert Pydantic model to dict and handle format conversion
         map_dict = map_data.dict(exclude_none=True)
         
@@ -122,7 +147,7 @@ async def create_map(
             db_format['CreatedBy'] = user.get('username')
         
         # Insert the map using corrected method
-        success = db_manager.insert_map(db_format)
+        success = await db_manager.insert_map_async(db_format)
         
         if success:
             logger.info(f"Map '{db_format.get('Number')}' created by {user.get('username')}")
@@ -155,16 +180,6 @@ async def update_map(
 ):
     """Update an existing map (Admin only)"""
     try:
-        db_manager = DatabaseManager()
-        
-        # Check if map exists using Number
-        existing_map = db_manager.get_map_by_track_number(map_number)
-        if not existing_map:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Map with Number {map_number} not found"
-            )
-        
         # Convert Pydantic model to dict, excluding None values
         update_dict = map_data.dict(exclude_none=True)
         
@@ -181,7 +196,7 @@ async def update_map(
         db_format['ModifiedBy'] = user.get('username')
         
         # Update the map using corrected method
-        success = db_manager.update_map(map_number, db_format)
+        success = await db_manager.update_map_async(map_number, db_format)
         
         if success:
             logger.info(f"Map {map_number} updated by {user.get('username')}")
@@ -190,11 +205,16 @@ async def update_map(
                 message="Map updated successfully",
                 data={"map_number": map_number}
             )
-        else:
+        # Zero rows updated: only now pay for the existence lookup to pick 404 vs 400
+        if not await db_manager.map_exists_async(map_number):
             raise HTTPException(
-                status_code=400,
-                detail="Failed to update map"
+                status_code=404,
+                detail=f"Map with Number {map_number} not found"
             )
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to update map"
+        )
             
     except HTTPException:
         raise
@@ -213,18 +233,8 @@ async def delete_map(
 ):
     """Delete a map (Admin only)"""
     try:
-        db_manager = DatabaseManager()
-        
-        # Check if map exists using Number
-        existing_map = db_manager.get_map_by_track_number(map_number)
-        if not existing_map:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Map with Number {map_number} not found"
-            )
-        
         # Delete the map using corrected method
-        success = db_manager.delete_map(map_number)
+        success = await db_manager.delete_map_async(map_number)
         
         if success:
             logger.info(f"Map {map_number} deleted by {user.get('username')}")
@@ -233,11 +243,16 @@ async def delete_map(
                 message="Map deleted successfully",
                 deleted_id=None  # Changed: can't use int for string IDs
             )
-        else:
+        # Zero rows deleted: only now pay for the existence lookup to pick 404 vs 400
+        if not await db_manager.map_exists_async(map_number):
             raise HTTPException(
-                status_code=400,
-                detail="Failed to delete map"
+                status_code=404,
+                detail=f"Map with Number {map_number} not found"
             )
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to delete map"
+        )
             
     except HTTPException:
         raise
@@ -255,36 +270,28 @@ async def search_maps(
 ):
     """Advanced search for maps"""
     try:
-        db_manager = DatabaseManager()
-        
         # Calculate offset
         offset = (search_request.page - 1) * search_request.page_size
         
         # Get maps data with search using corrected method
-        result = db_manager.get_maps_data(
+        result = await db_manager.get_maps_data_async(
             limit=search_request.page_size,
             offset=offset,
             search_term=search_request.search_term
         )
         
-        # Convert to response format
-        maps_data = []
-        for map_item in result["data"]:
-            try:
-                maps_data.append(MapResponse(**map_item))
-            except Exception as e:
-                logger.error(f"Error creating MapResponse for item {map_item}: {e}")
-                continue
-        
-        response = MapListResponse(
-            data=maps_data,
-            total_count=result["total_count"],
-            current_page=result["current_page"],
-            total_pages=result["total_pages"],
-            search_term=search_request.search_term,
-            has_next=result.get("has_next", False),
-            has_previous=result.get("has_previous", False)
-        )
+        # Rows go out as-is; returning the response directly skips response_model validation
+        maps_data = result["data"]
+        
+        response = ORJSONResponse({
+            "data": maps_data,
+            "total_count": result["total_count"],
+            "current_page": result["current_page"],
+            "total_pages": result["total_pages"],
+            "search_term": search_request.search_term,
+            "has_next": result.get("has_next", False),
+            "has_previous": result.get("has_previous", False)
+        })
         
         logger.info(f"Search returned {len(maps_data)} maps for term: {search_request.search_term}")
         return response
@@ -303,15 +310,18 @@ async def export_maps_csv(
 ):
     """Export maps data as CSV (Admin only)"""
     try:
-        db_manager = DatabaseManager()
+        timestamp = await db_manager.get_current_timestamp_async().replace('/', '-').replace(' ', '_').replace(':', '-')
+        filename = f"beisman_maps_export_{timestamp}.csv"
         
-        # Get all maps data (no pagination for export)
+        # Get all maps data (no pagination for export), streamed in batches
         if search:
-            all_maps = db_manager.search_maps(search)
+            rows = db_manager.iter_search_maps(search)
         else:
-            all_maps = db_manager.get_beisman_data(limit=10000)  # Large limit for export
+            rows = db_manager.iter_beisman_data(limit=10000)  # Large limit for export
         
-        if not all_maps:
+        # The first batch is fetched here, so run it off the event loop
+        first_row = await asyncio.to_thread(next, rows, None)
+        if first_row is None:
             raise HTTPException(
                 status_code=404,
                 detail="No maps found for export"
@@ -321,27 +331,32 @@ async def export_maps_csv(
         import csv
         import io
         
-        output = io.StringIO()
-        
-        # Use actual column names from data
-        fieldnames = list(all_maps[0].keys()) if all_maps else ['Number', 'Drawer', 'PropertyDetails']
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_maps)
-        
-        csv_content = output.getvalue()
-        output.close()
+        def generate_csv():
+            output = io.StringIO()
+            
+            # Use actual column names from data; every row dict has the same key
+            # order, so values are written positionally without DictWriter's per-row key checks
+            writer = csv.writer(output)
+            writer.writerow(first_row.keys())
+            writer.writerow(first_row.values())
+            # Bound methods hoisted out of the per-row loop
+            writerow, tell = writer.writerow, output.tell
+            for row in rows:
+                writerow(row.values())
+                # Flush in ~64 KB pieces so only one chunk is held in memory
+                if tell() >= 65536:
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate()
+            yield output.getvalue()
         
         # Return CSV response
-        from fastapi.responses import Response
+        from fastapi.responses import StreamingResponse
         
-        timestamp = db_manager.get_current_timestamp().replace('/', '-').replace(' ', '_').replace(':', '-')
-        filename = f"beisman_maps_export_{timestamp}.csv"
+        logger.info(f"Maps CSV export started by {user.get('username')}")
         
-        logger.info(f"Maps CSV export generated by {user.get('username')}: {len(all_maps)} records")
-        
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            generate_csv(),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -361,21 +376,19 @@ async def get_maps_stats(
 ):
     """Get maps statistics summary"""
     try:
-        db_manager = DatabaseManager()
-        
         # Get total count
-        total_maps = db_manager.get_beisman_data_count()
+        total_maps = await db_manager.get_beisman_data_count_async()
         
         stats = {
             "total_maps": total_maps,
-            "timestamp": db_manager.get_current_timestamp()
+            "timestamp": await db_manager.get_current_timestamp_async()
         }
         
         # Add admin-specific stats if user is admin
         if user and user.get('is_admin'):
             stats.update({
-                "database_status": "connected" if db_manager.test_connection() else "disconnected",
-                "last_update": db_manager.get_current_timestamp()
+                "database_status": "connected" if await db_manager.connection_ok_async() else "disconnected",
+                "last_update": await db_manager.get_current_timestamp_async()
             })
         
         logger.info(f"Maps stats retrieved: {total_maps} total maps")
@@ -413,14 +426,12 @@ async def bulk_delete_maps(
                 detail="Cannot delete more than 100 maps at once"
             )
         
-        db_manager = DatabaseManager()
-        
         deleted_count = 0
         failed_deletes = []
         
         for map_number in map_numbers:
             try:
-                success = db_manager.delete_map(map_number)
+                success = await db_manager.delete_map_async(map_number)
                 if success:
                     deleted_count += 1
                 else:
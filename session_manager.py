@@ -3,7 +3,9 @@ Session management module to avoid circular imports
 """
 import uuid
 import hashlib
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Optional
 import logging
 
@@ -16,27 +18,35 @@ def generate_session_id() -> str:
     """Generate a unique session ID"""
     return str(uuid.uuid4())
 
+@lru_cache(maxsize=1024)
 def hash_session_id(session_id: str) -> str:
-    """Hash session ID for security"""
+    """Hash session ID for security (memoized: the same IDs recur on every request)"""
     return hashlib.sha256(session_id.encode()).hexdigest()[:16]
 
+def _is_expired(session_data: Dict) -> bool:
+    """Expiry check against the monotonic deadline (wall-clock expires_at is for display)"""
+    expires_at_mono = session_data.get("expires_at_mono")
+    return bool(expires_at_mono) and time.monotonic() > expires_at_mono
+
 def create_session(username: str, is_admin: bool, display_name: str, remember_me: bool = False) -> tuple[str, Dict]:
     """Create a new session and return session_id and session_data"""
     session_id = generate_session_id()
     session_hash = hash_session_id(session_id)
     
+    now = datetime.now()
+    # 30 days for remember me, default 8 hours
+    lifetime = timedelta(days=30) if remember_me else timedelta(hours=8)
+    
     session_data = {
         "username": username,
         "is_admin": is_admin,
         "display_name": display_name,
-        "created_at": datetime.now(),
-        "expires_at": datetime.now() + timedelta(hours=8),  # Default 8 hours
+        "created_at": now,
+        "expires_at": now + lifetime,
+        "expires_at_mono": time.monotonic() + lifetime.total_seconds(),
         "remember_me": remember_me
     }
     
-    if remember_me:
-        session_data["expires_at"] = datetime.now() + timedelta(days=30)  # 30 days for remember me
-    
     active_sessions[session_hash] = session_data
     return session_id, session_data
 
@@ -52,7 +62,7 @@ def get_session(session_id: str) -> Optional[Dict]:
         return None
         
     # Check if session has expired
-    if session_data.get("expires_at") and datetime.now() > session_data["expires_at"]:
+    if _is_expired(session_data):
         # Session expired, remove it
         del active_sessions[session_hash]
         return None
@@ -78,11 +88,7 @@ def verify_session(session_data: Dict) -> bool:
         return False
         
     # Check expiration
-    expires_at = session_data.get("expires_at")
-    if expires_at and datetime.now() > expires_at:
-        return False
-        
-    return True
+    return not _is_expired(session_data)
 
 def extend_session(session_id: str, hours: int = 8) -> bool:
     """Extend session expiration time"""
@@ -91,17 +97,19 @@ def extend_session(session_id: str, hours: int = 8) -> bool:
         
     session_hash = hash_session_id(session_id)
     if session_hash in active_sessions:
-        active_sessions[session_hash]["expires_at"] = datetime.now() + timedelta(hours=hours)
+        lifetime = timedelta(hours=hours)
+        active_sessions[session_hash]["expires_at"] = datetime.now() + lifetime
+        active_sessions[session_hash]["expires_at_mono"] = time.monotonic() + lifetime.total_seconds()
         return True
     return False
 
 def cleanup_expired_sessions() -> int:
     """Clean up expired sessions and return count of cleaned sessions"""
-    current_time = datetime.now()
+    current_time = time.monotonic()
     expired_sessions = []
     
     for session_hash, session_data in active_sessions.items():
-        if session_data.get("expires_at") and current_time > session_data["expires_at"]:
+        if session_data.get("expires_at_mono") and current_time > session_data["expires_at_mono"]:
             expired_sessions.append(session_hash)
     
     for session_hash in expired_sessions:
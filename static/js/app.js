@@ -2,6 +2,53 @@
  * Beisman Maps Application JavaScript - Complete Version with Browser History Support
  */
 
+// Rows per page on the Browse Maps / Browse Entities pages
+const BROWSE_PAGE_SIZE = 10;
+
+// How long a GET response is reused before asking the server again
+const GET_CACHE_TTL_MS = 60000;
+
+const LOADING_HTML = '<div class="loading-content"><div class="loading-text">Loading...</div></div>';
+
+// Static A-Z filter row for Browse Entities, built once instead of on every render
+const ALPHABET_BUTTONS_HTML = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'.split('').map(letter =>
+    `<button class="alphabet-button" onclick="beismanApp.filterEntitiesByLetter('${letter}')">${letter}</button>`
+).join('') + '<button class="alphabet-button" onclick="beismanApp.filterEntitiesByLetter(null)">All</button>';
+
+// Routing tables, built once: page -> loader method, title and URL path
+const PAGE_LOADERS = {
+    'home': 'loadHomePage',
+    'admin-panel': 'loadAdminPanel',
+    'browse-maps': 'loadBrowseMaps',
+    'browse-entities': 'loadBrowseEntities',
+    'map-details': 'loadMapDetails',
+    'insert-map': 'loadInsertMap',
+    'update-delete': 'loadUpdateDelete'
+};
+
+const PAGE_TITLES = {
+    'home': 'Beisman Map Menu',
+    'admin-panel': 'Beisman Map Menu - Admin Panel',
+    'admin-login': 'Beisman Map Menu - Admin Login',
+    'browse-maps': 'Browse Beisman Maps',
+    'browse-entities': 'Browse Beisman Entities',
+    'map-details': 'Map Information',
+    'insert-map': 'Insert New Map',
+    'update-delete': 'Update/Delete Map'
+};
+
+// map-details is not listed: its path carries the map ID
+const PAGE_PATHS = {
+    'home': '/',
+    'admin-panel': '/admin-panel',
+    'browse-maps': '/browse-maps',
+    'browse-entities': '/browse-entities',
+    'insert-map': '/insert-map',
+    'update-delete': '/update-delete'
+};
+
+const PATH_PAGES = Object.fromEntries(Object.entries(PAGE_PATHS).map(([page, path]) => [path, page]));
+
 class BeismanMapApp {
     constructor() {
         this.currentUser = null;
@@ -9,6 +56,8 @@ class BeismanMapApp {
         this.sessionId = null;
         this.pageHistory = ['home'];
         this.selectedMapId = null;
+        this.responseCache = new Map(); // url -> { expires, data }
+        this.browseSearch = { maps: '', entities: '' }; // search applied to each browse page
         this.init();
     }
 
@@ -22,6 +71,31 @@ class BeismanMapApp {
         console.log('✅ Application initialized successfully');
     }
 
+    // GET a JSON API response, reusing a recent copy of the same URL
+    async fetchJson(url) {
+        const cached = this.responseCache.get(url);
+        if (cached && cached.expires > Date.now()) {
+            return cached.data;
+        }
+
+        const response = await fetch(url, {
+            credentials: 'include'
+        });
+
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+
+        const data = await response.json();
+        this.responseCache.set(url, { expires: Date.now() + GET_CACHE_TTL_MS, data });
+        return data;
+    }
+
+    // Forget cached GET responses after any successful write
+    invalidateCache() {
+        this.responseCache.clear();
+    }
+
     // NEW: Browser history management methods
     setupBrowserHistory() {
         // Listen for browser back/forward button clicks
@@ -47,28 +121,16 @@ class BeismanMapApp {
         console.log(`🔍 Loading initial route: ${path}`);
         
         // Map URL paths to application pages
-        if (path === '/' || path === '') {
-            this.currentPage = 'home';
-        } else if (path === '/admin-panel') {
-            this.currentPage = 'admin-panel';
-        } else if (path === '/browse-maps') {
-            this.currentPage = 'browse-maps';
-        } else if (path === '/browse-entities') {
-            this.currentPage = 'browse-entities';
-        } else if (path === '/insert-map') {
-            this.currentPage = 'insert-map';
-        } else if (path === '/update-delete') {
-            this.currentPage = 'update-delete';
-        } else if (path.startsWith('/map-details/')) {
+        if (path.startsWith('/map-details/')) {
             this.currentPage = 'map-details';
             // Extract map ID from URL
             const mapId = path.split('/map-details/')[1];
             if (mapId) {
-                this.selectedMapId = mapId;
+                this.selectedMapId = decodeURIComponent(mapId);
             }
         } else {
             // Unknown route, default to home
-            this.currentPage = 'home';
+            this.currentPage = PATH_PAGES[path] || 'home';
         }
         
         this.updatePageTitle();
@@ -78,17 +140,10 @@ class BeismanMapApp {
     // NEW: Update browser URL and history
     updateBrowserHistory(page, selectedMapId = null) {
         // Map application pages to URL paths
-        const urlPaths = {
-            'home': '/',
-            'admin-panel': '/admin-panel',
-            'browse-maps': '/browse-maps',
-            'browse-entities': '/browse-entities',
-            'insert-map': '/insert-map',
-            'update-delete': '/update-delete',
-            'map-details': selectedMapId ? `/map-details/${selectedMapId}` : '/map-details'
-        };
-
-        const newPath = urlPaths[page] || '/';
+        let newPath = PAGE_PATHS[page] || '/';
+        if (page === 'map-details') {
+            newPath = selectedMapId ? `/map-details/${encodeURIComponent(selectedMapId)}` : '/map-details';
+        }
         const state = {
             page: page,
             selectedMapId: selectedMapId
@@ -125,6 +180,25 @@ class BeismanMapApp {
         document.addEventListener('click', (e) => {
             if (e.target.classList.contains('modal-backdrop')) {
                 this.closeLoginModal();
+                return;
+            }
+
+            // Row "Details" links are real hrefs; plain clicks stay in the SPA,
+            // modified clicks fall through so the browser can open a new tab
+            const mapLink = e.target.closest('[data-map-id]');
+            if (mapLink) {
+                if (e.button === 0 && !e.ctrlKey && !e.metaKey && !e.shiftKey) {
+                    e.preventDefault();
+                    this.showMapDetails(mapLink.dataset.mapId);
+                }
+                return;
+            }
+
+            // One delegated handler for every navigation link marked with data-page
+            const navLink = e.target.closest('[data-page]');
+            if (navLink) {
+                e.preventDefault();
+                this.navigateTo(navLink.dataset.page);
             }
         });
 
@@ -315,19 +389,9 @@ class BeismanMapApp {
 
     updatePageTitle() {
         const pageTitle = document.getElementById('page-title');
-        const pageTitles = {
-            'home': 'Beisman Map Menu',
-            'admin-panel': 'Beisman Map Menu - Admin Panel',
-            'admin-login': 'Beisman Map Menu - Admin Login',
-            'browse-maps': 'Browse Beisman Maps',
-            'browse-entities': 'Browse Beisman Entities',
-            'map-details': 'Map Information',
-            'insert-map': 'Insert New Map',
-            'update-delete': 'Update/Delete Map'
-        };
 
         if (pageTitle) {
-            pageTitle.textContent = pageTitles[this.currentPage] || 'Beisman Map Menu';
+            pageTitle.textContent = PAGE_TITLES[this.currentPage] || 'Beisman Map Menu';
         }
     }
 
@@ -335,41 +399,16 @@ class BeismanMapApp {
         const contentArea = document.getElementById('content-area');
         if (!contentArea) return;
 
-        contentArea.innerHTML = '<div class="loading-content"><div class="loading-text">Loading...</div></div>';
-
-        switch (this.currentPage) {
-            case 'home':
-                this.loadHomePage(contentArea);
-                break;
-            case 'admin-panel':
-                this.loadAdminPanel(contentArea);
-                break;
-            case 'browse-maps':
-                this.loadBrowseMaps(contentArea);
-                break;
-            case 'browse-entities':
-                this.loadBrowseEntities(contentArea);
-                break;
-            case 'map-details':
-                this.loadMapDetails(contentArea);
-                break;
-            case 'insert-map':
-                this.loadInsertMap(contentArea);
-                break;
-            case 'update-delete':
-                this.loadUpdateDelete(contentArea);
-                break;
-            default:
-                this.loadHomePage(contentArea);
-        }
+        // Unknown pages fall back to home
+        this[PAGE_LOADERS[this.currentPage] || 'loadHomePage'](contentArea);
     }
 
     loadHomePage(container) {
         container.innerHTML = `
             <div class="page-content">
                 <div class="nav-container">
-                    <a href="#" class="nav-link" onclick="beismanApp.navigateTo('browse-maps'); return false;">Browse Maps</a>
-                    <a href="#" class="nav-link" onclick="beismanApp.navigateTo('browse-entities'); return false;">Browse Entities</a>
+                    <a href="#" class="nav-link" data-page="browse-maps">Browse Maps</a>
+                    <a href="#" class="nav-link" data-page="browse-entities">Browse Entities</a>
                 </div>
             </div>
         `;
@@ -384,9 +423,9 @@ class BeismanMapApp {
         container.innerHTML = `
             <div class="page-content">
                 <div class="nav-container">
-                    <a href="#" class="nav-link" onclick="beismanApp.navigateTo('browse-maps'); return false;">Browse Maps</a>
-                    <a href="#" class="nav-link" onclick="beismanApp.navigateTo('browse-entities'); return false;">Browse Entities</a>
-                    <a href="#" class="nav-link" onclick="beismanApp.navigateTo('insert-map'); return false;">Insert New Map</a>
+                    <a href="#" class="nav-link" data-page="browse-maps">Browse Maps</a>
+                    <a href="#" class="nav-link" data-page="browse-entities">Browse Entities</a>
+                    <a href="#" class="nav-link" data-page="insert-map">Insert New Map</a>
                 </div>
             </div>
         `;
@@ -396,17 +435,15 @@ class BeismanMapApp {
     }
 
     showAdminStatus() {
-        // Remove any existing admin status
-        const existing = document.querySelector('.admin-session-status');
-        if (existing) {
-            existing.remove();
+        // The badge content never changes, so keep an existing one instead of rebuilding it
+        if (document.querySelector('.admin-session-status')) {
+            return;
         }
 
         // Create and append admin status directly to body
         const adminStatus = document.createElement('div');
         adminStatus.className = 'admin-session-status';
         adminStatus.textContent = 'Administrator Session Active';
-        adminStatus.style.cssText = 'position: fixed !important; bottom: 5px !important; left: 20px !important; font-size: 10px !important; color: #000080 !important; font-style: italic !important; font-family: "MS Sans Serif", sans-serif !important; z-index: 9999 !important; pointer-events: none !important;';
         
         document.body.appendChild(adminStatus);
         console.log('✅ Admin status added to bottom of screen');
@@ -421,23 +458,19 @@ class BeismanMapApp {
     }
 
     async loadBrowseMaps(container) {
+        // Only the fetch-backed pages need a placeholder while the request is in flight
+        container.innerHTML = LOADING_HTML;
+
         try {
             let backDestination = this.currentUser?.isAdmin ? 'admin-panel' : 'home';
             let backText = this.currentUser?.isAdmin ? '← Back to Admin Panel' : '← Back to Main Menu';
 
-            const response = await fetch('/api/maps?page=1&page_size=10', {
-                credentials: 'include'
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
+            this.browseSearch.maps = '';
+            const data = await this.fetchJson(`/api/maps?page=1&page_size=${BROWSE_PAGE_SIZE}`);
             
             container.innerHTML = `
                 <div class="page-content">
-                    <a href="#" class="back-button" onclick="beismanApp.navigateTo('${backDestination}'); return false;">${backText}</a>
+                    <a href="#" class="back-button" data-page="${backDestination}">${backText}</a>
                     
                     <div class="search-container">
                         <div class="search-row">
@@ -452,11 +485,7 @@ class BeismanMapApp {
                     </div>
                     
                     <div class="pagination">
-                        <div class="pagination-info">
-                            Page ${data.current_page} of ${data.total_pages}<br>
-                            Displaying records 1 - ${data.data.length} of ${data.total_count}
-                        </div>
-                        ${this.renderPaginationButtons(data.current_page, data.total_pages, 'maps')}
+                        ${this.renderPagination(data, 'maps')}
                     </div>
                 </div>
             `;
@@ -472,31 +501,24 @@ class BeismanMapApp {
     }
 
     async loadBrowseEntities(container) {
+        // Only the fetch-backed pages need a placeholder while the request is in flight
+        container.innerHTML = LOADING_HTML;
+
         try {
             let backDestination = this.currentUser?.isAdmin ? 'admin-panel' : 'home';
             let backText = this.currentUser?.isAdmin ? '← Back to Admin Panel' : '← Back to Main Menu';
 
-            const response = await fetch('/api/entities?page=1&page_size=10', {
-                credentials: 'include'
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
+            this.browseSearch.entities = '';
+            const data = await this.fetchJson(`/api/entities?page=1&page_size=${BROWSE_PAGE_SIZE}`);
             
             container.innerHTML = `
                 <div class="page-content">
-                    <a href="#" class="back-button" onclick="beismanApp.navigateTo('${backDestination}'); return false;">${backText}</a>
+                    <a href="#" class="back-button" data-page="${backDestination}">${backText}</a>
                     
                     <div class="alphabet-filter">
                         <div>Filter by first letter:</div>
                         <div class="alphabet-row">
-                            ${'ABCDEFGHIJKLMNOPQRSTUVWXYZ'.split('').map(letter => 
-                                `<button class="alphabet-button" onclick="beismanApp.filterEntitiesByLetter('${letter}')">${letter}</button>`
-                            ).join('')}
-                            <button class="alphabet-button" onclick="beismanApp.filterEntitiesByLetter(null)">All</button>
+                            ${ALPHABET_BUTTONS_HTML}
                         </div>
                     </div>
                     
@@ -513,11 +535,7 @@ class BeismanMapApp {
                     </div>
                     
                     <div class="pagination">
-                        <div class="pagination-info">
-                            Page ${data.current_page} of ${data.total_pages}<br>
-                            Displaying records 1 - ${data.data.length} of ${data.total_count}
-                        </div>
-                        ${this.renderPaginationButtons(data.current_page, data.total_pages, 'entities')}
+                        ${this.renderPagination(data, 'entities')}
                     </div>
                 </div>
             `;
@@ -542,14 +560,14 @@ class BeismanMapApp {
                 
                 <div class="bottom-navigation">
                     <div class="nav-row">
-                        <a href="#" class="nav-link" onclick="beismanApp.navigateTo('${homeDestination}'); return false;">Home</a>
+                        <a href="#" class="nav-link" data-page="${homeDestination}">Home</a>
                         <a href="#" class="nav-link" onclick="beismanApp.goBack(); return false;">Back</a>
-                        <a href="#" class="nav-link" onclick="beismanApp.navigateTo('browse-maps'); return false;">Browse Maps</a>
-                        <a href="#" class="nav-link" onclick="beismanApp.navigateTo('browse-entities'); return false;">Browse Entities</a>
+                        <a href="#" class="nav-link" data-page="browse-maps">Browse Maps</a>
+                        <a href="#" class="nav-link" data-page="browse-entities">Browse Entities</a>
                         ${this.currentUser?.isAdmin ? `
-                            <a href="#" class="nav-link" onclick="beismanApp.navigateTo('insert-map'); return false;">Insert Map</a>
-                            <a href="#" class="nav-link" onclick="beismanApp.navigateTo('update-delete'); return false;">Update/Delete</a>
-                            <a href="#" class="nav-link" onclick="beismanApp.navigateTo('delete-entities'); return false;">Delete Entities</a>
+                            <a href="#" class="nav-link" data-page="insert-map">Insert Map</a>
+                            <a href="#" class="nav-link" data-page="update-delete">Update/Delete</a>
+                            <a href="#" class="nav-link" data-page="delete-entities">Delete Entities</a>
                         ` : ''}
                     </div>
                 </div>
@@ -561,15 +579,7 @@ class BeismanMapApp {
 
     async loadMapDetailsData(mapId) {
         try {
-            const response = await fetch(`/api/maps/${mapId}`, {
-                credentials: 'include'
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const mapData = await response.json();
+            const mapData = await this.fetchJson(`/api/maps/${mapId}`);
             
             const detailsContent = document.getElementById('map-details-content');
             if (detailsContent) {
@@ -607,15 +617,7 @@ class BeismanMapApp {
 
     async loadMapEntities(mapId) {
         try {
-            const response = await fetch(`/api/entities?search=${mapId}`, {
-                credentials: 'include'
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const entitiesData = await response.json();
+            const entitiesData = await this.fetchJson(`/api/entities?search=${mapId}`);
             
             const entitiesList = document.getElementById('entities-list');
             if (entitiesList) {
@@ -644,7 +646,7 @@ class BeismanMapApp {
 
         container.innerHTML = `
             <div class="page-content">
-                <a href="#" class="back-button" onclick="beismanApp.navigateTo('admin-panel'); return false;">← Back to Admin Panel</a>
+                <a href="#" class="back-button" data-page="admin-panel">← Back to Admin Panel</a>
                 <hr>
                 
                 <div class="form-container">
@@ -664,7 +666,7 @@ class BeismanMapApp {
                         <hr>
                         <div class="form-actions">
                             <button type="submit" class="windows-button primary">Insert</button>
-                            <button type="button" class="windows-button" onclick="beismanApp.navigateTo('admin-panel')">Cancel</button>
+                            <button type="button" class="windows-button" data-page="admin-panel">Cancel</button>
                         </div>
                     </form>
                 </div>
@@ -690,7 +692,7 @@ class BeismanMapApp {
         if (!this.selectedMapId) {
             container.innerHTML = `
                 <div class="page-content">
-                    <a href="#" class="back-button" onclick="beismanApp.navigateTo('admin-panel'); return false;">← Back to Admin Panel</a>
+                    <a href="#" class="back-button" data-page="admin-panel">← Back to Admin Panel</a>
                     <div class="status-message warning">Please select a map first by clicking Details from Browse Maps.</div>
                 </div>
             `;
@@ -700,7 +702,7 @@ class BeismanMapApp {
         // Show loading while we fetch the map data
         container.innerHTML = `
             <div class="page-content">
-                <a href="#" class="back-button" onclick="beismanApp.navigateTo('map-details'); return false;">← Back to Map Details</a>
+                <a href="#" class="back-button" data-page="map-details">← Back to Map Details</a>
                 <div class="loading-content"><div class="loading-text">Loading map for editing...</div></div>
             </div>
         `;
@@ -713,51 +715,20 @@ class BeismanMapApp {
         try {
             console.log(`📝 Loading map ${this.selectedMapId} for editing`);
 
-            // Fetch map data
-            const mapResponse = await fetch(`/api/maps/${this.selectedMapId}`, {
-                credentials: 'include'
-            });
-
-            if (!mapResponse.ok) {
-                throw new Error(`Failed to load map: HTTP ${mapResponse.status}`);
-            }
-
-            const mapData = await mapResponse.json();
+            // Map and its entity names in one request (cached until the next write)
+            const { map: mapData, entities } = await this.fetchJson(
+                `/api/maps/${encodeURIComponent(this.selectedMapId)}/with-entities`
+            );
             console.log(`📋 Map data loaded:`, mapData);
 
-            // Try to fetch entities for this map using the existing search method
-            let mapEntities = [];
-            try {
-                const entitiesResponse = await fetch(`/api/entities?search=${this.selectedMapId}`, {
-                    credentials: 'include'
-                });
-
-                if (entitiesResponse.ok) {
-                    const entitiesResult = await entitiesResponse.json();
-                    // Handle both possible response formats
-                    if (entitiesResult.data && Array.isArray(entitiesResult.data)) {
-                        mapEntities = entitiesResult.data;
-                    } else if (Array.isArray(entitiesResult)) {
-                        mapEntities = entitiesResult;
-                    }
-                    
-                    // Filter entities that match this map number
-                    mapEntities = mapEntities.filter(entity => 
-                        entity.BeismanNumber == this.selectedMapId || 
-                        entity.BeismanNumber === this.selectedMapId.toString()
-                    );
-                }
-            } catch (entitiesError) {
-                console.warn('Could not load entities:', entitiesError);
-                mapEntities = [];
-            }
+            const mapEntities = entities.map(name => ({ EntityName: name, BeismanNumber: mapData.Number }));
 
             console.log(`👥 Found ${mapEntities.length} entities for this map`);
 
             // Render the edit form
             container.innerHTML = `
                 <div class="page-content">
-                    <a href="#" class="back-button" onclick="beismanApp.navigateTo('map-details'); return false;">← Back to Map Details</a>
+                    <a href="#" class="back-button" data-page="map-details">← Back to Map Details</a>
                     
                     <div class="form-container">
                         <div class="form-header">Update Map Information</div>
@@ -781,7 +752,7 @@ class BeismanMapApp {
                             
                             <div class="form-actions">
                                 <button type="submit" class="windows-button primary">Update Map</button>
-                                <button type="button" class="windows-button" onclick="beismanApp.navigateTo('map-details')">Cancel</button>
+                                <button type="button" class="windows-button" data-page="map-details">Cancel</button>
                             </div>
                         </form>
                     </div>
@@ -823,7 +794,7 @@ class BeismanMapApp {
             console.error('❌ Error loading map for editing:', error);
             container.innerHTML = `
                 <div class="page-content">
-                    <a href="#" class="back-button" onclick="beismanApp.navigateTo('admin-panel'); return false;">← Back to Admin Panel</a>
+                    <a href="#" class="back-button" data-page="admin-panel">← Back to Admin Panel</a>
                     <div class="status-message error">Failed to load map for editing: ${error.message}</div>
                 </div>
             `;
@@ -836,15 +807,37 @@ class BeismanMapApp {
             return '<div class="status-message info">No entities associated with this map.</div>';
         }
 
+        // One checkbox per entity and a single action, so any number of
+        // removals goes to the server as one bulk request
         return entities.map(entity => `
-            <div class="browse-row" style="display: flex; justify-content: space-between; align-items: center;">
-                <div style="flex: 1;">${entity.EntityName || ''}</div>
+            <div class="browse-row entity-edit-row">
+                <div class="col-1">${entity.EntityName || ''}</div>
                 <div>
-                    <a href="#" class="nav-link" onclick="beismanApp.removeEntityFromMap('${entity.EntityName}'); return false;" 
-                       style="color: #ff0000;">Remove</a>
+                    <input type="checkbox" class="entity-remove-checkbox" value="${(entity.EntityName || '').replace(/"/g, '&quot;')}">
                 </div>
             </div>
-        `).join('');
+        `).join('') + `
+            <div class="form-actions">
+                <a href="#" class="nav-link remove-link" onclick="beismanApp.removeSelectedEntities(); return false;">Remove Selected</a>
+            </div>
+        `;
+    }
+
+    async refreshEntitiesForEditing() {
+        const entitiesList = document.getElementById('entities-edit-list');
+        if (!entitiesList) return;
+
+        try {
+            const { map: mapData, entities } = await this.fetchJson(
+                `/api/maps/${encodeURIComponent(this.selectedMapId)}/with-entities`
+            );
+            entitiesList.innerHTML = this.renderEntitiesForEditing(
+                entities.map(name => ({ EntityName: name, BeismanNumber: mapData.Number }))
+            );
+        } catch (error) {
+            console.error('❌ Error refreshing entities:', error);
+            entitiesList.innerHTML = '<div class="status-message error">Failed to load entities.</div>';
+        }
     }
 
     async handleUpdateMap() {
@@ -880,6 +873,7 @@ class BeismanMapApp {
             const result = await response.json();
 
             if (result.success) {
+                this.invalidateCache();
                 alert('Map updated successfully!');
                 console.log(`✅ Map ${this.selectedMapId} updated successfully`);
                 // Refresh the editing view
@@ -920,14 +914,15 @@ class BeismanMapApp {
             const result = await response.json();
 
             if (result.success) {
+                this.invalidateCache();
                 alert('Entity added successfully!');
                 console.log(`✅ Entity "${entityName}" added to map ${this.selectedMapId}`);
                 
                 // Clear the input field
                 document.getElementById('new-entity-name').value = '';
                 
-                // Refresh the editing view
-                this.loadMapForEditing(document.getElementById('content-area'));
+                // Only the entity list changed; the map form stays as it is
+                this.refreshEntitiesForEditing();
             } else {
                 alert(result.message || 'Failed to add entity');
             }
@@ -938,34 +933,47 @@ class BeismanMapApp {
         }
     }
 
-    async removeEntityFromMap(entityName) {
+    async removeSelectedEntities() {
         try {
-            if (!confirm(`Are you sure you want to remove "${entityName}" from this map?`)) {
+            const entityNames = Array.from(
+                document.querySelectorAll('#entities-edit-list .entity-remove-checkbox:checked'),
+                checkbox => checkbox.value
+            );
+
+            if (entityNames.length === 0) {
+                alert('Select at least one entity to remove.');
                 return;
             }
 
-            console.log(`🗑️ Removing entity "${entityName}" from map ${this.selectedMapId}`);
+            if (!confirm(`Are you sure you want to remove ${entityNames.length} entit${entityNames.length === 1 ? 'y' : 'ies'} from this map?`)) {
+                return;
+            }
 
-            const response = await fetch(`/api/entities/map/${this.selectedMapId}/${encodeURIComponent(entityName)}`, {
-                method: 'DELETE',
-                credentials: 'include'
+            console.log(`🗑️ Removing ${entityNames.length} entities from map ${this.selectedMapId}`);
+
+            const response = await fetch(`/api/entities/map/${encodeURIComponent(this.selectedMapId)}/bulk-remove`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                credentials: 'include',
+                body: JSON.stringify(entityNames)
             });
 
             const result = await response.json();
 
             if (result.success) {
-                alert('Entity removed successfully!');
-                console.log(`✅ Entity "${entityName}" removed from map ${this.selectedMapId}`);
+                this.invalidateCache();
+                alert(`${result.data.removed_count} entities removed successfully!`);
+                console.log(`✅ ${result.data.removed_count} entities removed from map ${this.selectedMapId}`);
                 
-                // Refresh the editing view
-                this.loadMapForEditing(document.getElementById('content-area'));
+                // Only the entity list changed; the map form stays as it is
+                this.refreshEntitiesForEditing();
             } else {
-                alert(result.message || 'Failed to remove entity');
+                alert(result.message || result.detail || 'Failed to remove entities');
             }
 
         } catch (error) {
-            console.error('❌ Error removing entity:', error);
-            alert('Network error while removing entity');
+            console.error('❌ Error removing entities:', error);
+            alert('Network error while removing entities');
         }
     }
 
@@ -976,19 +984,19 @@ class BeismanMapApp {
 
         return `
             <div class="browse-columns">
-                <div class="column-header" style="flex: 1;">Details</div>
-                <div class="column-header" style="flex: 2;">Number</div>
-                <div class="column-header" style="flex: 2;">Drawer</div>
-                <div class="column-header" style="flex: 4;">PropertyDetails</div>
+                <div class="column-header col-1">Details</div>
+                <div class="column-header col-2">Number</div>
+                <div class="column-header col-2">Drawer</div>
+                <div class="column-header col-4">PropertyDetails</div>
             </div>
             ${maps.map(map => `
                 <div class="browse-row">
-                    <div style="flex: 1;">
-                        <a href="#" class="nav-link" onclick="beismanApp.showMapDetails('${map.Number}'); return false;">Details</a>
+                    <div class="col-1">
+                        <a href="/map-details/${encodeURIComponent(map.Number)}" class="nav-link" data-map-id="${map.Number}">Details</a>
                     </div>
-                    <div style="flex: 2;">${map.Number || ''}</div>
-                    <div style="flex: 2;">${map.Drawer || ''}</div>
-                    <div style="flex: 4;">${map.PropertyDetails || ''}</div>
+                    <div class="col-2">${map.Number || ''}</div>
+                    <div class="col-2">${map.Drawer || ''}</div>
+                    <div class="col-4">${map.PropertyDetails || ''}</div>
                 </div>
             `).join('')}
         `;
@@ -1001,36 +1009,49 @@ class BeismanMapApp {
 
         return `
             <div class="browse-columns">
-                <div class="column-header" style="flex: 1;">Details</div>
-                <div class="column-header" style="flex: 4;">Entity Name</div>
-                <div class="column-header" style="flex: 2;">Map Number</div>
+                <div class="column-header col-1">Details</div>
+                <div class="column-header col-4">Entity Name</div>
+                <div class="column-header col-2">Map Number</div>
             </div>
             ${entities.map(entity => `
                 <div class="browse-row">
-                    <div style="flex: 1;">
-                        <a href="#" class="nav-link" onclick="beismanApp.showMapDetails(${entity.BeismanNumber}); return false;">Details</a>
+                    <div class="col-1">
+                        <a href="/map-details/${encodeURIComponent(entity.BeismanNumber)}" class="nav-link" data-map-id="${entity.BeismanNumber}">Details</a>
                     </div>
-                    <div style="flex: 4;">${entity.EntityName || ''}</div>
-                    <div style="flex: 2;">${entity.BeismanNumber || ''}</div>
+                    <div class="col-4">${entity.EntityName || ''}</div>
+                    <div class="col-2">${entity.BeismanNumber || ''}</div>
                 </div>
             `).join('')}
         `;
     }
 
+    // Page info plus Previous/Next for one page of browse results
+    renderPagination(data, type) {
+        const first = (data.current_page - 1) * BROWSE_PAGE_SIZE + 1;
+        const last = first + data.data.length - 1;
+        return `
+            <div class="pagination-info">
+                ${data.search_term ? `Search results for "${data.search_term}" - ` : ''}Page ${data.current_page} of ${data.total_pages}<br>
+                Displaying records ${data.data.length ? first : 0} - ${data.data.length ? last : 0} of ${data.total_count}
+            </div>
+            ${this.renderPaginationButtons(data.current_page, data.total_pages, type)}
+        `;
+    }
+
     renderPaginationButtons(currentPage, totalPages, type) {
         if (totalPages <= 1) return '';
 
-        let buttons = '';
-        
+        const buttons = [];
+
         if (currentPage > 1) {
-            buttons += `<button class="pagination-button" onclick="beismanApp.loadPage('${type}', ${currentPage - 1})">⬅️ Previous</button>`;
+            buttons.push(`<button class="pagination-button" onclick="beismanApp.loadPage('${type}', ${currentPage - 1})">⬅️ Previous</button>`);
         }
-        
+
         if (currentPage < totalPages) {
-            buttons += `<button class="pagination-button" onclick="beismanApp.loadPage('${type}', ${currentPage + 1})">Next ➡️</button>`;
+            buttons.push(`<button class="pagination-button" onclick="beismanApp.loadPage('${type}', ${currentPage + 1})">Next ➡️</button>`);
         }
-        
-        return buttons;
+
+        return buttons.join('');
     }
 
     // UPDATED: Now includes URL update
@@ -1067,6 +1088,7 @@ class BeismanMapApp {
             const result = await response.json();
 
             if (result.success) {
+                this.invalidateCache();
                 alert('Map inserted successfully!');
                 document.getElementById('insert-map-form').reset();
             } else {
@@ -1079,157 +1101,47 @@ class BeismanMapApp {
     }
 
     async searchMaps() {
-        try {
-            const searchTerm = document.getElementById('maps-search').value.trim();
-            console.log(`🔍 Searching maps for: "${searchTerm}"`);
+        const searchTerm = document.getElementById('maps-search').value.trim();
+        console.log(`🔍 Searching maps for: "${searchTerm}"`);
 
-            // Show loading state
-            const resultsContainer = document.querySelector('.results-container');
-            if (resultsContainer) {
-                resultsContainer.innerHTML = '<div class="loading-content"><div class="loading-text">Searching...</div></div>';
-            }
-
-            // Build API URL with search term
-            let apiUrl = '/api/maps?page=1&page_size=50';
-            if (searchTerm) {
-                apiUrl += `&search=${encodeURIComponent(searchTerm)}`;
-            }
-
-            console.log(`📡 Making API call to: ${apiUrl}`);
-
-            // Make API call
-            const response = await fetch(apiUrl, {
-                credentials: 'include'
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
-            console.log(`📊 Search returned ${data.data.length} maps`);
-
-            // Update the results display
-            if (resultsContainer) {
-                resultsContainer.innerHTML = this.renderMapsResults(data.data);
-            }
-
-            // Update pagination info to show search results
-            const paginationDiv = document.querySelector('.pagination');
-            if (paginationDiv) {
-                const paginationInfo = paginationDiv.querySelector('.pagination-info');
-                if (paginationInfo) {
-                    if (searchTerm) {
-                        paginationInfo.innerHTML = `
-                            Search results for "${searchTerm}"<br>
-                            ${data.data.length} record(s) found
-                        `;
-                    } else {
-                        paginationInfo.innerHTML = `
-                            Page ${data.current_page} of ${data.total_pages}<br>
-                            Displaying records 1 - ${data.data.length} of ${data.total_count}
-                        `;
-                    }
-                }
-
-                // Hide pagination buttons when searching
-                const paginationButtons = paginationDiv.querySelectorAll('.pagination-button');
-                paginationButtons.forEach(button => {
-                    button.style.display = searchTerm ? 'none' : 'inline-block';
-                });
-            }
-
-            console.log(`🎉 Maps search completed successfully`);
-
-        } catch (error) {
-            console.error('❌ Error searching maps:', error);
-            const resultsContainer = document.querySelector('.results-container');
-            if (resultsContainer) {
-                resultsContainer.innerHTML = '<div class="status-message error">Failed to search maps. Please try again.</div>';
-            }
+        // Show loading state
+        const resultsContainer = document.querySelector('.results-container');
+        if (resultsContainer) {
+            resultsContainer.innerHTML = '<div class="loading-content"><div class="loading-text">Searching...</div></div>';
         }
+
+        // Results are paged like the browse view; the pager keeps the search applied
+        this.browseSearch.maps = searchTerm;
+        await this.loadPage('maps', 1);
     }
 
     resetMapsSearch() {
         document.getElementById('maps-search').value = '';
-        this.loadCurrentPage();
+        this.browseSearch.maps = '';
+        // Swap the first page back in (served from the response cache) instead of rebuilding the page
+        this.loadPage('maps', 1);
     }
 
     async searchEntities() {
-        try {
-            const searchTerm = document.getElementById('entities-search').value.trim();
-            console.log(`🔍 Searching entities for: "${searchTerm}"`);
-
-            // Show loading state
-            const resultsContainer = document.querySelector('.results-container');
-            if (resultsContainer) {
-                resultsContainer.innerHTML = '<div class="loading-content"><div class="loading-text">Searching...</div></div>';
-            }
-
-            // Build API URL with search term
-            let apiUrl = '/api/entities?page=1&page_size=50';
-            if (searchTerm) {
-                apiUrl += `&search=${encodeURIComponent(searchTerm)}`;
-            }
-
-            console.log(`📡 Making API call to: ${apiUrl}`);
-
-            // Make API call
-            const response = await fetch(apiUrl, {
-                credentials: 'include'
-            });
+        const searchTerm = document.getElementById('entities-search').value.trim();
+        console.log(`🔍 Searching entities for: "${searchTerm}"`);
 
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
-            console.log(`📊 Search returned ${data.data.length} entities`);
-
-            // Update the results display
-            if (resultsContainer) {
-                resultsContainer.innerHTML = this.renderEntitiesResults(data.data);
-            }
-
-            // Update pagination info to show search results
-            const paginationDiv = document.querySelector('.pagination');
-            if (paginationDiv) {
-                const paginationInfo = paginationDiv.querySelector('.pagination-info');
-                if (paginationInfo) {
-                    if (searchTerm) {
-                        paginationInfo.innerHTML = `
-                            Search results for "${searchTerm}"<br>
-                            ${data.data.length} record(s) found
-                        `;
-                    } else {
-                        paginationInfo.innerHTML = `
-                            Page ${data.current_page} of ${data.total_pages}<br>
-                            Displaying records 1 - ${data.data.length} of ${data.total_count}
-                        `;
-                    }
-                }
-
-                // Hide pagination buttons when searching
-                const paginationButtons = paginationDiv.querySelectorAll('.pagination-button');
-                paginationButtons.forEach(button => {
-                    button.style.display = searchTerm ? 'none' : 'inline-block';
-                });
-            }
-
-            console.log(`🎉 Entities search completed successfully`);
-
-        } catch (error) {
-            console.error('❌ Error searching entities:', error);
-            const resultsContainer = document.querySelector('.results-container');
-            if (resultsContainer) {
-                resultsContainer.innerHTML = '<div class="status-message error">Failed to search entities. Please try again.</div>';
-            }
+        // Show loading state
+        const resultsContainer = document.querySelector('.results-container');
+        if (resultsContainer) {
+            resultsContainer.innerHTML = '<div class="loading-content"><div class="loading-text">Searching...</div></div>';
         }
+
+        // Results are paged like the browse view; the pager keeps the search applied
+        this.browseSearch.entities = searchTerm;
+        await this.loadPage('entities', 1);
     }
 
     resetEntitiesSearch() {
         document.getElementById('entities-search').value = '';
-        this.loadCurrentPage();
+        this.browseSearch.entities = '';
+        // Swap the first page back in (served from the response cache) instead of rebuilding the page
+        this.loadPage('entities', 1);
     }
 
     async filterEntitiesByLetter(letter) {
@@ -1258,16 +1170,8 @@ class BeismanMapApp {
 
             console.log(`📡 Making API call to: ${apiUrl}`);
 
-            // Make API call
-            const response = await fetch(apiUrl, {
-                credentials: 'include'
-            });
-
-            if (!response.ok) {
-                throw new Error(`HTTP ${response.status}`);
-            }
-
-            const data = await response.json();
+            // Make API call (repeat filters are served from the response cache)
+            const data = await this.fetchJson(apiUrl);
             console.log(`📊 Received ${data.data.length} entities from API`);
 
             let filteredEntities = data.data;
@@ -1326,8 +1230,27 @@ class BeismanMapApp {
         }
     }
 
+    // Fetch one server-side page of browse results and swap it in place
     async loadPage(type, page) {
-        console.log('Loading page:', type, page);
+        const resultsContainer = document.querySelector('.results-container');
+        const paginationDiv = document.querySelector('.pagination');
+        if (!resultsContainer || !paginationDiv) return;
+
+        let apiUrl = `/api/${type}?page=${page}&page_size=${BROWSE_PAGE_SIZE}`;
+        if (this.browseSearch[type]) {
+            apiUrl += `&search=${encodeURIComponent(this.browseSearch[type])}`;
+        }
+
+        try {
+            const data = await this.fetchJson(apiUrl);
+            resultsContainer.innerHTML = type === 'maps'
+                ? this.renderMapsResults(data.data)
+                : this.renderEntitiesResults(data.data);
+            paginationDiv.innerHTML = this.renderPagination(data, type);
+        } catch (error) {
+            console.error(`❌ Error loading ${type} page ${page}:`, error);
+            resultsContainer.innerHTML = `<div class="status-message error">Failed to load ${type}. Please try again.</div>`;
+        }
     }
 }
 
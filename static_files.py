@@ -0,0 +1,153 @@
+"""
+Static file serving with precomputed ETags and pre-gzipped text assets
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from starlette.staticfiles import StaticFiles
+
+logger = logging.getLogger(__name__)
+
+# Text assets worth compressing once on disk rather than per request
+GZIP_SUFFIXES = {".css", ".js", ".svg", ".html", ".ico", ".json", ".map"}
+GZIP_MIN_SIZE = 1024
+
+def _precompress(path: Path) -> Optional[Path]:
+    """Write path.gz next to a compressible file unless an up-to-date one exists"""
+    if path.suffix not in GZIP_SUFFIXES:
+        return None
+    try:
+        stat = path.stat()
+        if stat.st_size < GZIP_MIN_SIZE:
+            return None
+        gz_path = path.with_name(path.name + ".gz")
+        if not gz_path.exists() or gz_path.stat().st_mtime_ns < stat.st_mtime_ns:
+            gz_path.write_bytes(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
+        return gz_path
+    except OSError as e:
+        logger.warning(f"Could not precompress {path}: {e}")
+        return None
+
+# Content-hashed bundles never change under the same name
+BUNDLE_PREFIX = "bundle."
+IMMUTABLE_CACHE_CONTROL = b"public, max-age=31536000, immutable"
+
+def build_bundle(directory, sources: List[str], subdir: str, suffix: str) -> Optional[str]:
+    """Concatenate static sources into subdir/bundle.<hash><suffix>; returns its URL path"""
+    directory = Path(directory)
+    try:
+        data = b"\n".join((directory / source).read_bytes() for source in sources)
+        name = f"{BUNDLE_PREFIX}{hashlib.blake2b(data, digest_size=8).hexdigest()}{suffix}"
+        bundle_dir = directory / subdir
+        target = bundle_dir / name
+        if not target.exists():
+            # Drop bundles (and their .gz copies) from earlier builds
+            for old in bundle_dir.glob(f"{BUNDLE_PREFIX}*{suffix}*"):
+                old.unlink()
+            target.write_bytes(data)
+    except OSError as e:
+        logger.warning(f"Could not build {suffix} bundle, serving sources individually: {e}")
+        return None
+    return f"/static/{subdir}/{name}"
+
+def _weak_etag(path: Path) -> bytes:
+    """Weak ETag from the CRC32 of the file contents"""
+    return f'W/"{zlib.crc32(path.read_bytes()):08x}"'.encode("latin-1")
+
+class CachedStaticFiles:
+    """StaticFiles wrapper that answers If-None-Match from ETags computed at startup
+    and serves the pre-gzipped copy of text assets to clients that accept it"""
+
+    def __init__(self, directory, cache_control: str = "no-cache"):
+        self.directory = Path(directory)
+        self.app = StaticFiles(directory=self.directory)
+        self.cache_control = cache_control.encode("latin-1")
+        # Mount-relative path ("/css/styles.css") -> (mtime_ns, size, etag)
+        self._etags: Dict[str, Tuple[int, int, bytes]] = {}
+        # Paths with a .gz sibling
+        self._gzipped: Set[str] = set()
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".gz"):
+                    self._load(Path(root) / name)
+        logger.info(f"Computed ETags for {len(self._etags)} static files")
+
+    def _load(self, path: Path) -> Optional[bytes]:
+        try:
+            stat = path.stat()
+            etag = _weak_etag(path)
+        except OSError:
+            return None
+        key = "/" + path.relative_to(self.directory).as_posix()
+        self._etags[key] = (stat.st_mtime_ns, stat.st_size, etag)
+        
+        if path.suffix != ".gz":
+            gz_path = _precompress(path)
+            if gz_path is not None and self._load(gz_path) is not None:
+                self._gzipped.add(key)
+            else:
+                self._gzipped.discard(key)
+        return etag
+
+    def _etag_for(self, request_path: str) -> Optional[bytes]:
+        entry = self._etags.get(request_path)
+        if entry is None:
+            return None
+        mtime_ns, size, etag = entry
+        # A stat is enough to notice an edited file; only then is it re-read
+        path = self.directory / request_path.lstrip("/")
+        try:
+            stat = path.stat()
+        except OSError:
+            self._etags.pop(request_path, None)
+            return None
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return self._load(path)
+        return etag
+
+    async def __call__(self, scope, receive, send):
+        path = scope["path"] if scope["type"] == "http" else None
+        etag = self._etag_for(path) if path else None
+        if etag is None:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope["headers"])
+        cache_control = IMMUTABLE_CACHE_CONTROL if path.rpartition("/")[2].startswith(BUNDLE_PREFIX) else self.cache_control
+        response_headers = [(b"etag", etag), (b"cache-control", cache_control)]
+        if path in self._gzipped:
+            response_headers.append((b"vary", b"Accept-Encoding"))
+            gz_etag = self._etag_for(path + ".gz") if b"gzip" in request_headers.get(b"accept-encoding", b"") else None
+            if gz_etag is not None:
+                # StaticFiles serves the .gz file; its content type is guessed from the inner suffix
+                scope = dict(scope, path=path + ".gz")
+                response_headers = [(b"etag", gz_etag), (b"cache-control", cache_control),
+                                    (b"vary", b"Accept-Encoding"), (b"content-encoding", b"gzip")]
+                etag = gz_etag
+
+        if_none_match = request_headers.get(b"if-none-match")
+        if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(b",")):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": response_headers,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value) for name, value in message.get("headers", [])
+                    if name not in (b"etag", b"cache-control")
+                ]
+                message["headers"] = headers + response_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
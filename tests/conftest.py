@@ -0,0 +1,37 @@
+"""
+Test configuration: stand in for pyodbc where the native driver isn't installed,
+so database.py can be imported without an ODBC driver manager.
+"""
+
+import importlib
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    importlib.import_module("pyodbc")
+except ImportError:
+    _pyodbc = types.ModuleType("pyodbc")
+
+    class Error(Exception):
+        pass
+
+    class OperationalError(Error):
+        pass
+
+    class InterfaceError(Error):
+        pass
+
+    def connect(*args, **kwargs):
+        raise OperationalError("pyodbc is stubbed in tests; no database is available")
+
+    _pyodbc.Error = Error
+    _pyodbc.OperationalError = OperationalError
+    _pyodbc.InterfaceError = InterfaceError
+    _pyodbc.connect = connect
+    _pyodbc.pooling = True
+    _pyodbc.SQL_WCHAR = -8
+    _pyodbc.SQL_WVARCHAR = -9
+    sys.modules["pyodbc"] = _pyodbc
@@ -0,0 +1,103 @@
+"""
+_TTLCache expiry/eviction and the _retry_transient decorator
+"""
+
+import pytest
+
+import database
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(database.time, "monotonic", clock)
+    return clock
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(database.time, "sleep", sleeps.append)
+    return sleeps
+
+def test_cache_get_put(clock):
+    cache = database._TTLCache(maxsize=4, ttl=30)
+    assert cache.get("a") is None
+
+    cache.put("a", [1, 2])
+    assert cache.get("a") == [1, 2]
+
+def test_cache_entries_expire(clock):
+    cache = database._TTLCache(maxsize=4, ttl=30)
+    cache.put("a", 1)
+
+    clock.now += 29.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+
+def test_cache_evicts_least_recently_used(clock):
+    cache = database._TTLCache(maxsize=2, ttl=30)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Reading "a" makes "b" the oldest entry
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_cache_pop_and_clear(clock):
+    cache = database._TTLCache(maxsize=4, ttl=30)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.get("b") is None
+
+def _flaky(failures, error=None):
+    """A function that raises `error` on its first `failures` calls"""
+    calls = []
+
+    @database._retry_transient
+    def read():
+        calls.append(None)
+        if len(calls) <= failures:
+            raise error or database.pyodbc.OperationalError("connection reset")
+        return "rows"
+
+    return read, calls
+
+def test_retry_recovers_from_transient_errors(sleeps):
+    read, calls = _flaky(failures=2)
+
+    assert read() == "rows"
+    assert len(calls) == 3
+    assert sleeps == [database._RETRY_BASE_DELAY, database._RETRY_BASE_DELAY * 2]
+
+def test_retry_reraises_after_last_attempt(sleeps):
+    read, calls = _flaky(failures=database._RETRY_ATTEMPTS)
+
+    with pytest.raises(database.pyodbc.OperationalError):
+        read()
+    assert len(calls) == database._RETRY_ATTEMPTS
+    assert len(sleeps) == database._RETRY_ATTEMPTS - 1
+
+def test_retry_ignores_other_errors(sleeps):
+    read, calls = _flaky(failures=1, error=ValueError("bad query"))
+
+    with pytest.raises(ValueError):
+        read()
+    assert len(calls) == 1
+    assert sleeps == []
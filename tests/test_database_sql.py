@@ -0,0 +1,42 @@
+"""
+SQL builders for the bulk entity statements
+"""
+
+import pytest
+
+import database
+
+TABLE = "BeismanDB.dbo.Entities"
+
+@pytest.mark.parametrize("count", [1, 2, database._MAX_IN_PARAMS - 1])
+def test_existing_entities_sql(count):
+    names = [f"name{i}" for i in range(count)]
+    sql, params = database._existing_entities_sql(TABLE, "003-A", names)
+
+    assert sql.endswith(f"[EntityName] IN ({', '.join(['?'] * count)})")
+    assert sql.count("?") == len(params) == count + 1
+    assert params == ["003-A", *names]
+
+@pytest.mark.parametrize("count", [1, 2, database._MAX_IN_PARAMS - 1])
+def test_insert_entities_sql(count):
+    names = [f"name{i}" for i in range(count)]
+    sql, params = database._insert_entities_sql(TABLE, "003-A", names)
+
+    assert f"(VALUES {', '.join(['(?)'] * count)}) AS v([EntityName])" in sql
+    assert sql.count("?") == len(params) == count + 2
+    assert params == ["003-A", *names, "003-A"]
+    # Within SQL Server's 2100-parameter limit
+    assert len(params) <= 2100
+
+@pytest.mark.parametrize("count", [1, 2, database._MAX_IN_PARAMS - 1])
+def test_remove_entities_sql(count):
+    names = [f"name{i}" for i in range(count)]
+    sql, params = database._remove_entities_sql(TABLE, "003-A", names)
+
+    assert sql.startswith(f"DELETE FROM {TABLE} WHERE [BeismanNumber] = ? AND [EntityName] IN (")
+    assert sql.count("?") == len(params) == count + 1
+    assert params == ["003-A", *names]
+
+def test_two_names_produce_grouped_placeholders():
+    sql, _ = database._insert_entities_sql(TABLE, "1", ["a", "b"])
+    assert "(VALUES (?), (?))" in sql